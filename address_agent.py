@@ -1,10 +1,15 @@
 """Main agent module for OneTrueAddress - compares addresses using Claude."""
+from itertools import chain
 from typing import Dict, Any, Optional, List
+from cachetools import LRUCache
 from golden_source import GoldenSourceConnector
 from claude_client import ClaudeClient
-from config import CONFIDENCE_THRESHOLD
+from config import CONFIDENCE_THRESHOLD, FUZZY_PRELOAD_INDEX, GOLDEN_SOURCE_MATCH_TABLE, INTERNAL_MATCH_TABLE
+import hashlib
+import heapq
 import json
 import re
+import threading
 
 
 class AddressAgent:
@@ -14,6 +19,14 @@ class AddressAgent:
         """Initialize the address agent."""
         self.claude_client = ClaudeClient(claude_api_key)
         self.golden_source = GoldenSourceConnector()
+        # Parsed Claude reviews keyed by a hash of the review prompt (input + ordered candidates + scores)
+        self._review_cache = LRUCache(maxsize=1024)
+        self._review_cache_lock = threading.Lock()
+        
+        # Optionally index both tables up front so searches skip the per-request database scan
+        if FUZZY_PRELOAD_INDEX:
+            for table_name in (GOLDEN_SOURCE_MATCH_TABLE, INTERNAL_MATCH_TABLE):
+                self.golden_source.preload_fuzzy_index(table_name)
     
     def _check_exact_match(self, golden_address: Dict[str, Any], internal_matches: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -90,7 +103,8 @@ class AddressAgent:
             threshold: Optional fuzzy match threshold (50-100). If None, uses default from config.
             
         Returns:
-            Dictionary containing the match result with fuzzy match scores
+            Dictionary containing the match result with fuzzy match scores. 'degraded' is True when
+            a table couldn't be searched or the Claude review failed (the result is a fallback).
         """
         # Perform fuzzy matching search
         print("Performing fuzzy match search on MasterAddress column...")
@@ -99,6 +113,7 @@ class AddressAgent:
         golden_source_matches = match_results.get('golden_source_matches', [])
         internal_matches = match_results.get('internal_matches', [])
         total_matches = match_results.get('total_matches', 0)
+        search_errors = match_results.get('search_errors', {})
         
         # Check if we have NO matches at all
         if total_matches == 0:
@@ -111,24 +126,27 @@ class AddressAgent:
                 "candidates_searched": 0,
                 "search_method": "fuzzy_match",
                 "has_golden_source": False,
-                "has_internal": False
+                "has_internal": False,
+                "degraded": bool(search_errors)
             }
         
         # We have matches in at least one table
-        # Get the best match overall (from whichever table has results)
-        all_matches = golden_source_matches + internal_matches
-        all_matches.sort(key=lambda x: x.get('_similarity_score', 0), reverse=True)
+        # Get the best matches overall (from whichever table has results); only the top 10 are
+        # used, so select them with a heap instead of sorting every match
+        top_matches = heapq.nlargest(
+            10, chain(golden_source_matches, internal_matches), key=lambda x: x.get('_similarity_score', 0)
+        )
         
         # Send fuzzy results to Claude for review
         print(f"\n{'='*60}")
         print(f"SENDING FUZZY MATCHES TO CLAUDE FOR REVIEW")
         print(f"{'='*60}")
-        print(f"Total matches to review: {len(all_matches)}")
+        print(f"Total matches to review: {len(golden_source_matches) + len(internal_matches)}")
         
         # Send matches to Claude for individual analysis
         claude_review = self._review_fuzzy_matches_with_claude(
             input_address, 
-            all_matches[:10],  # Send top 10 matches
+            top_matches,  # Send top 10 matches
             golden_source_matches[:10],
             internal_matches[:10]
         )
@@ -159,11 +177,11 @@ class AddressAgent:
         
         # Get Claude's recommended best match or use fuzzy match result
         if claude_review.get('match_found'):
-            best_match = claude_review.get('best_match', all_matches[0])
-            best_score = claude_review.get('confidence', all_matches[0].get('_similarity_score', 0))
+            best_match = claude_review.get('best_match', top_matches[0])
+            best_score = claude_review.get('confidence', top_matches[0].get('_similarity_score', 0))
             claude_reasoning = claude_review.get('reasoning', 'Claude reviewed and confirmed the match')
         else:
-            best_match = all_matches[0]
+            best_match = top_matches[0]
             best_score = best_match.get('_similarity_score', 0)
             claude_reasoning = claude_review.get('reasoning', 'Fuzzy match result')
         
@@ -213,7 +231,8 @@ class AddressAgent:
             "confidence_threshold": FUZZY_MATCH_THRESHOLD,
             "candidates_searched": total_matches,
             "search_method": "fuzzy_match_with_ai",
-            "matched_address": best_match  # For compatibility with existing code
+            "matched_address": best_match,  # For compatibility with existing code
+            "degraded": bool(search_errors) or claude_review.get('review_failed', False)
         }
     
     def _review_fuzzy_matches_with_claude(
@@ -289,33 +308,47 @@ Return your analysis in JSON format with analysis for EVERY match:
     }}
 }}"""
 
-            print(f"\n[Sending to Claude for Review]")
-            print(f"Prompt length: {len(prompt)} characters")
-            print(f"\n--- PROMPT START ---")
-            print(prompt)
-            print(f"--- PROMPT END ---\n")
-            
-            # Call Claude API directly with our custom prompt
-            message = self.claude_client.client.messages.create(
-                model="claude-sonnet-4-5",
-                max_tokens=4096,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ]
-            )
+            # The prompt captures everything the review depends on, so an identical prompt
+            # (same input, same candidates in the same order with the same scores) reuses the answer
+            review_key = hashlib.sha1(prompt.encode('utf-8')).hexdigest()
+            with self._review_cache_lock:
+                parsed_response = self._review_cache.get(review_key)
             
-            # Extract the response
-            response_text = message.content[0].text
-            print(f"\n[Raw Claude Response]")
-            print(f"{response_text[:500]}..." if len(response_text) > 500 else response_text)
-            
-            parsed_response = self._parse_claude_response(response_text)
-            
-            print(f"[Claude Review Received]")
-            print(f"Response: {parsed_response}")
+            if parsed_response is not None:
+                print(f"\n[Using cached Claude review]")
+            else:
+                print(f"\n[Sending to Claude for Review]")
+                print(f"Prompt length: {len(prompt)} characters")
+                print(f"\n--- PROMPT START ---")
+                print(prompt)
+                print(f"--- PROMPT END ---\n")
+                
+                # Call Claude API directly with our custom prompt
+                message = self.claude_client.client.messages.create(
+                    model="claude-sonnet-4-5",
+                    max_tokens=4096,
+                    messages=[
+                        {
+                            "role": "user",
+                            "content": prompt
+                        }
+                    ]
+                )
+                
+                # Extract the response
+                response_text = message.content[0].text
+                print(f"\n[Raw Claude Response]")
+                print(f"{response_text[:500]}..." if len(response_text) > 500 else response_text)
+                
+                parsed_response = self._parse_claude_response(response_text)
+                
+                print(f"[Claude Review Received]")
+                print(f"Response: {parsed_response}")
+                
+                # Only reviews that parsed as JSON are worth reusing
+                if isinstance(parsed_response, dict) and 'raw_text' not in parsed_response:
+                    with self._review_cache_lock:
+                        self._review_cache[review_key] = parsed_response
             
             # Extract Claude's recommended match
             if isinstance(parsed_response, dict):
@@ -359,7 +392,7 @@ Return your analysis in JSON format with analysis for EVERY match:
                 
                 print(f"  Total converted analyses: {len(converted_analyses)}")
                 
-                return {
+                review = {
                     "match_found": parsed_response.get('match_found', True),
                     "best_match": recommended_match,
                     "confidence": parsed_response.get('confidence', all_matches[0].get('_similarity_score', 0) if all_matches else 0),
@@ -368,6 +401,10 @@ Return your analysis in JSON format with analysis for EVERY match:
                     "fuzzy_score": all_matches[0].get('_similarity_score', 0) if all_matches else 0,
                     "match_analyses": converted_analyses
                 }
+                if 'raw_text' in parsed_response:
+                    # Claude answered, but not with the JSON we asked for
+                    review['review_failed'] = True
+                return review
             else:
                 # If Claude's response can't be parsed, fall back to fuzzy match result
                 return {
@@ -377,7 +414,8 @@ Return your analysis in JSON format with analysis for EVERY match:
                     "reasoning": "Using fuzzy match result (Claude review unavailable)",
                     "concerns": None,
                     "fuzzy_score": all_matches[0].get('_similarity_score', 0),
-                    "match_analyses": {}
+                    "match_analyses": {},
+                    "review_failed": True
                 }
                 
         except Exception as e:
@@ -390,7 +428,8 @@ Return your analysis in JSON format with analysis for EVERY match:
                 "reasoning": f"Using fuzzy match result (Claude review failed: {str(e)})",
                 "concerns": None,
                 "fuzzy_score": all_matches[0].get('_similarity_score', 0),
-                "match_analyses": {}
+                "match_analyses": {},
+                "review_failed": True
             }
     
     def _parse_claude_response(self, response_text: str) -> Dict[str, Any]:
@@ -454,4 +493,5 @@ Return your analysis in JSON format with analysis for EVERY match:
     def close(self):
         """Close connections and clean up resources."""
         self.golden_source.close()
+        self.claude_client.close()
 
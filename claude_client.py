@@ -18,8 +18,13 @@ class ClaudeClient:
                 f"Invalid API key format. Claude API keys should start with 'sk-ant-api'. "
                 f"Your key starts with: {self.api_key[:15]}..."
             )
+        # One client per process: its HTTP connection pool keeps connections to the API alive between requests
         self.client = Anthropic(api_key=self.api_key)
     
+    def close(self):
+        """Close the HTTP connection pool."""
+        self.client.close()
+    
     def extract_search_criteria(self, input_address: str) -> dict:
         """
         Use Claude to extract search criteria from an input address.
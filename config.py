@@ -1,4 +1,5 @@
 """Configuration module for OneTrueAddress agent."""
+import logging
 import os
 from dotenv import load_dotenv
 
@@ -16,6 +17,14 @@ GOLDEN_SOURCE_DATABASE = os.getenv("GOLDEN_SOURCE_DATABASE")
 GOLDEN_SOURCE_USER = os.getenv("GOLDEN_SOURCE_USER")
 GOLDEN_SOURCE_PASSWORD = os.getenv("GOLDEN_SOURCE_PASSWORD")
 GOLDEN_SOURCE_TABLE = os.getenv("GOLDEN_SOURCE_TABLE", "addresses")
+GOLDEN_SOURCE_POOL_MIN = int(os.getenv("GOLDEN_SOURCE_POOL_MIN", "2"))  # PostgreSQL connections opened up front
+GOLDEN_SOURCE_POOL_MAX = int(os.getenv("GOLDEN_SOURCE_POOL_MAX", "10"))  # Max concurrent PostgreSQL connections
+
+# Web Server Configuration
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").strip().upper()  # Set to DEBUG for request dumps and consolidation details
+if not isinstance(logging.getLevelName(LOG_LEVEL), int):
+    LOG_LEVEL = "INFO"  # Unrecognized level names (e.g. "verbose") fall back to INFO instead of failing at startup
+MAX_REQUEST_BYTES = int(os.getenv("MAX_REQUEST_BYTES", str(1024 * 1024)))  # Larger request bodies are rejected with 413
 
 # Golden Source and Internal Tables Configuration
 GOLDEN_SOURCE_MATCH_TABLE = os.getenv("GOLDEN_SOURCE_MATCH_TABLE", "team_cool_and_gang.pinellas_fl")
@@ -27,4 +36,16 @@ CONFIDENCE_THRESHOLD = float(os.getenv("CONFIDENCE_THRESHOLD", "90.0"))  # Defau
 # Fuzzy Matching Configuration
 FUZZY_MATCH_THRESHOLD = float(os.getenv("FUZZY_MATCH_THRESHOLD", "90.0"))  # Default 90% similarity
 FUZZY_MATCH_MIN_THRESHOLD = 75.0  # Minimum allowed threshold (floor)
+# PostgreSQL only: prefilter candidates with pg_trgm (requires the extension and a trigram index)
+FUZZY_TRGM_PREFILTER = os.getenv("FUZZY_TRGM_PREFILTER", "false").strip().lower() in ("1", "true", "yes")
+FUZZY_TRGM_LIMIT = int(os.getenv("FUZZY_TRGM_LIMIT", "500"))  # Max trigram candidates rescored per table
+# Load every MasterAddress into memory at startup, bucketed by street number (memory for speed)
+FUZZY_PRELOAD_INDEX = os.getenv("FUZZY_PRELOAD_INDEX", "false").strip().lower() in ("1", "true", "yes")
+
+# Cache Configuration
+FILTER_CACHE_TTL = float(os.getenv("FILTER_CACHE_TTL", "60"))  # Seconds to cache filtered golden source reads
+FUZZY_CORPUS_CACHE_TTL = float(os.getenv("FUZZY_CORPUS_CACHE_TTL", "300"))  # Seconds to reuse fuzzy-match candidates
+FUZZY_CORPUS_CACHE_SIZE = int(os.getenv("FUZZY_CORPUS_CACHE_SIZE", "4096"))  # Max (table, street number) candidate sets cached
+TIME_SAVED_CACHE_TTL = float(os.getenv("TIME_SAVED_CACHE_TTL", "10"))  # Seconds to reuse the time saved total
+MATCH_CACHE_TTL = float(os.getenv("MATCH_CACHE_TTL", "60"))  # Seconds to reuse a /match result for the same address
 
@@ -1,7 +1,22 @@
 """Module for connecting to and querying the golden source address table."""
+import csv
+import io
+import logging
 import os
+import re
+import sys
+import threading
+import time
+from collections import ChainMap
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
+from functools import lru_cache, wraps
+from operator import attrgetter
 from typing import List, Dict, Any, Optional, Tuple
-from rapidfuzz import fuzz
+import numpy as np
+from cachetools import TTLCache, cachedmethod
+from rapidfuzz import fuzz, process
 from config import (
     GOLDEN_SOURCE_DB_TYPE,
     GOLDEN_SOURCE_HOST,
@@ -12,16 +27,160 @@ from config import (
     GOLDEN_SOURCE_TABLE,
     GOLDEN_SOURCE_MATCH_TABLE,
     INTERNAL_MATCH_TABLE,
-    FUZZY_MATCH_THRESHOLD
+    FUZZY_MATCH_THRESHOLD,
+    FILTER_CACHE_TTL,
+    FUZZY_CORPUS_CACHE_TTL,
+    FUZZY_CORPUS_CACHE_SIZE,
+    GOLDEN_SOURCE_POOL_MIN,
+    GOLDEN_SOURCE_POOL_MAX,
+    TIME_SAVED_CACHE_TTL,
+    FUZZY_TRGM_PREFILTER,
+    FUZZY_TRGM_LIMIT
 )
 
+_log = logging.getLogger(__name__)
+
+# Columns returned by get_filtered_addresses (in SELECT order)
+_FILTER_COLUMNS = ('address1', 'address2', 'Mailing City', 'state', 'zipcode')
+
+# PostgreSQL expression for a MasterAddress street number - the same rule as _extract_street_number
+# (leading digits plus an optional letter, uppercased). Keep in sync with the expression index in
+# README.md "Database Requirements" so the candidate scan can use it.
+_STREET_NUMBER_SQL = 'upper(substring("MasterAddress" FROM \'^\\s*([0-9]+[A-Za-z]?)\'))'
+
+# Rows per round trip when streaming the fuzzy-match candidate scan
+_SCAN_BATCH_SIZE = 5000
+
+# Matched addresses per full-row query (stays under SQLite's 999 bound-parameter limit on older builds)
+_ROW_FETCH_BATCH_SIZE = 500
+
+# Precompiled patterns for fuzzy-match address normalization
+# State/zip: a trailing 2-letter state code, a ", ST" state code, or a 5 or 5+4 digit zip
+_STATE_ZIP = re.compile(r'\b[A-Z]{2}\b\s*$|,\s*[A-Z]{2}\b|\b\d{5}(?:-\d{4})?\b')
+_WS = re.compile(r'\s+')
+_COMMAS = re.compile(r',+')
+_STREETNUM = re.compile(r'^(\d+[A-Za-z]?)')
+
+# Flag values treated as "yes" (compared after strip().upper())
+_TRUTHY = frozenset({'Y', 'YES', 'TRUE', '1'})
+
+# Bad Type placeholders that aren't worth concatenating (compared lowercased, like the dedup key)
+_SKIP_BAD_TYPE = frozenset({'none', 'n/a', 'null', ''})
+
+
+def _normalize_column_name(name: str) -> str:
+    """Normalize a column name for flexible matching ('Address_1' -> 'address 1')."""
+    return name.lower().replace('_', ' ').strip()
+
+
+# Flexible column-name patterns for applying Golden Source address fields, in priority order
+# (normalized once at import time)
+_FIELD_PATTERNS_NORM = {
+    field_name: tuple(_normalize_column_name(pattern) for pattern in patterns)
+    for field_name, patterns in {
+        'address1': ['address1', 'address_1', 'address 1', 'address', 'street', 'street address', 'street_address'],
+        'address2': ['address2', 'address_2', 'address 2', 'address line 2', 'address_line_2'],
+        'state': ['state', 'st'],
+        'zipcode': ['zipcode', 'zip_code', 'zip code', 'zip', 'postal', 'postalcode', 'postal_code'],
+        'MasterAddress': ['MasterAddress', 'master_address', 'master address']
+    }.items()
+}
+
+
+# Scenario fields added to every internal_updates row (keys interned; they're written for every record)
+_AGENT_ACTION_KEY = sys.intern('Agent Action')
+_TPI_KEY = sys.intern('tpi')
+_DATETIME_KEY = sys.intern('datetime')
+
+# Agent Action and task priority indicator per push scenario
+_SCENARIO_META = {
+    1: {
+        _AGENT_ACTION_KEY: sys.intern('Multiple Internal Matches (Consolidation Required)'),
+        _TPI_KEY: 20
+    },
+    2: {
+        _AGENT_ACTION_KEY: sys.intern('Single Internal Match with MasterAddress Mismatch'),
+        _TPI_KEY: 10
+    },
+    3: {
+        _AGENT_ACTION_KEY: sys.intern('No Internal Match (Golden Source Only)'),
+        _TPI_KEY: 5
+    }
+}
+
+
+@lru_cache(maxsize=200_000)
+def _canon(address: str) -> str:
+    """Canonical form for token_sort_ratio-style scoring: lowercased, tokens sorted, single-spaced."""
+    return " ".join(sorted(address.lower().split()))
+
+
+def _split_metadata_fields(record) -> Tuple[Dict[str, Any], List[str]]:
+    """Split a record into its regular fields and the names of metadata fields (starting with _), in one pass."""
+    filtered = {}
+    removed = []
+    for key, value in record.items():
+        if key.startswith('_'):
+            removed.append(key)
+        else:
+            filtered[key] = value
+    return filtered, removed
+
+
+def _filter_cache_key(connector, search_criteria: dict, limit: int = 100) -> tuple:
+    """Cache key for get_filtered_addresses - only the criteria that shape the query."""
+    return (
+        search_criteria.get("state"),
+        search_criteria.get("city"),
+        search_criteria.get("street_name"),
+        search_criteria.get("street_type"),
+        limit,
+    )
+
+
+def _with_connection(method):
+    """Run a connector method with a connection borrowed from the pool for the current thread."""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._borrow_connection():
+            return method(self, *args, **kwargs)
+    return wrapper
+
 
 class GoldenSourceConnector:
     """Handles connection to the golden source address database."""
     
     def __init__(self):
         self.db_type = GOLDEN_SOURCE_DB_TYPE
-        self.connection = None
+        # PostgreSQL uses a connection pool; other databases share a single connection
+        self._pool = None
+        self._pool_slots = None
+        self._connection = None
+        # Pool connection borrowed by the current thread (see _borrow_connection)
+        self._local = threading.local()
+        # Preloaded street-number indexes per table: (loaded_at (time.monotonic()), {street number: corpus});
+        # a reload swaps in a whole new index, so searches never see a half-built one
+        self._preloaded_tables: Dict[str, Tuple[float, Dict[str, Tuple]]] = {}
+        # One reload per table at a time (see reload_if_stale)
+        self._preload_locks: Dict[str, threading.Lock] = {}
+        self._preload_locks_guard = threading.Lock()
+        # Last successful get_time_saved result and when it expires (time.monotonic())
+        self._time_saved_cache: Tuple[Optional[Dict[str, Any]], float] = (None, 0.0)
+        # Bumped by every successful write and cache invalidation, so callers caching results
+        # derived from this data (e.g. web_app's /match cache) can tell they're out of date
+        self.write_generation = 0
+        # Runs one table's fuzzy search in parallel with the other (only when pooling)
+        self._search_executor = None
+        # Short-lived cache of filtered golden source reads (hot state/city pairs repeat)
+        self._filter_cache = TTLCache(maxsize=1024, ttl=FILTER_CACHE_TTL)
+        self._filter_cache_lock = threading.Lock()
+        # Consolidation column names resolved per record key set (schemas are stable per session)
+        self._col_cache: Dict[frozenset, Dict[str, Optional[str]]] = {}
+        # Column names per table, so schema probes don't cost a round trip per search
+        self._table_columns: Dict[str, List[str]] = {}
+        # Scanned fuzzy-match candidates per (table, street number) - see _build_corpus
+        self._corpus_cache = TTLCache(maxsize=FUZZY_CORPUS_CACHE_SIZE, ttl=FUZZY_CORPUS_CACHE_TTL)
+        self._corpus_cache_lock = threading.Lock()
         self._connect()
     
     def _connect(self):
@@ -43,15 +202,24 @@ class GoldenSourceConnector:
                 raise ValueError("GOLDEN_SOURCE_PASSWORD environment variable is not set")
             
             try:
-                self.connection = psycopg2.connect(
+                from psycopg2.pool import ThreadedConnectionPool
+                
+                # Pool connections so concurrent requests don't serialize on one connection
+                self._pool = ThreadedConnectionPool(
+                    GOLDEN_SOURCE_POOL_MIN,
+                    GOLDEN_SOURCE_POOL_MAX,
                     host=GOLDEN_SOURCE_HOST,
                     port=GOLDEN_SOURCE_PORT,
                     database=GOLDEN_SOURCE_DATABASE,
                     user=GOLDEN_SOURCE_USER,
                     password=GOLDEN_SOURCE_PASSWORD
                 )
-                # Enable autocommit mode for read-only queries to avoid transaction issues
-                self.connection.autocommit = True
+                # Callers wait for a free connection instead of getting a PoolError
+                self._pool_slots = threading.BoundedSemaphore(GOLDEN_SOURCE_POOL_MAX)
+                self._search_executor = ThreadPoolExecutor(
+                    max_workers=max(1, GOLDEN_SOURCE_POOL_MAX // 2),
+                    thread_name_prefix="fuzzy-search"
+                )
             except Exception as e:
                 error_msg = str(e)
                 error_type = type(e).__name__
@@ -99,7 +267,7 @@ class GoldenSourceConnector:
                 raise ValueError("GOLDEN_SOURCE_PASSWORD environment variable is not set")
             
             try:
-                self.connection = mysql.connector.connect(
+                self._connection = mysql.connector.connect(
                     host=GOLDEN_SOURCE_HOST,
                     port=GOLDEN_SOURCE_PORT,
                     database=GOLDEN_SOURCE_DATABASE,
@@ -122,25 +290,77 @@ class GoldenSourceConnector:
         elif self.db_type.lower() == "sqlite":
             try:
                 import sqlite3
-                self.connection = sqlite3.connect(GOLDEN_SOURCE_DATABASE)
+                self._connection = sqlite3.connect(GOLDEN_SOURCE_DATABASE)
             except ImportError:
                 raise ImportError("sqlite3 should be included with Python")
         else:
             raise ValueError(f"Unsupported database type: {self.db_type}")
     
-    def get_all_addresses(self) -> List[Dict[str, Any]]:
-        """Retrieve all addresses from the golden source table."""
-        cursor = self.connection.cursor()
+    @property
+    def _param(self) -> str:
+        """Query parameter placeholder for the driver (sqlite3 uses ?, psycopg2 and MySQL use %s)."""
+        return '?' if self.db_type.lower() == "sqlite" else '%s'
+    
+    @property
+    def connection(self):
+        """The current thread's borrowed pool connection, or the shared connection when not pooling."""
+        borrowed = getattr(self._local, 'connection', None)
+        return borrowed if borrowed is not None else self._connection
+    
+    @contextmanager
+    def _borrow_connection(self):
+        """
+        Borrow a pooled connection for the current thread and return it to the pool afterwards.
+        
+        Re-entrant: nested calls on the same thread reuse the connection already borrowed.
+        Without a pool this just yields the shared connection.
+        """
+        if self._pool is None or getattr(self._local, 'connection', None) is not None:
+            yield self.connection
+            return
+        
+        self._pool_slots.acquire()
+        try:
+            conn = self._pool.getconn()
+            try:
+                # Enable autocommit mode for read-only queries to avoid transaction issues
+                if not conn.autocommit:
+                    conn.autocommit = True
+                self._local.connection = conn
+                yield conn
+            finally:
+                self._local.connection = None
+                # Discard connections that dropped so the pool opens a fresh one next time
+                self._pool.putconn(conn, close=bool(conn.closed))
+        finally:
+            self._pool_slots.release()
+    
+    def _get_table_columns(self, cursor, table_name: str) -> List[str]:
+        """
+        Get the column names of a table (in ordinal order).
+        
+        Schemas don't change between requests, so the result is cached per table name;
+        call invalidate_caches() after DDL changes.
+        
+        Args:
+            cursor: Open database cursor to run the lookup with
+            table_name: Table name, optionally schema-qualified
+            
+        Returns:
+            List of column names (empty if the table wasn't found)
+        """
+        columns = self._table_columns.get(table_name)
+        if columns is not None:
+            return columns
         
         # Parse schema and table name if schema-qualified
-        table_parts = GOLDEN_SOURCE_TABLE.split('.')
+        table_parts = table_name.split('.')
         if len(table_parts) == 2:
-            schema_name, table_name = table_parts
+            schema_name, table_only = table_parts
         else:
             schema_name = None
-            table_name = GOLDEN_SOURCE_TABLE
+            table_only = table_name
         
-        # Try to get column names first
         if self.db_type.lower() == "postgresql":
             if schema_name:
                 # Handle schema-qualified table names
@@ -149,22 +369,43 @@ class GoldenSourceConnector:
                     FROM information_schema.columns 
                     WHERE table_schema = %s AND table_name = %s
                     ORDER BY ordinal_position
-                """, (schema_name, table_name))
+                """, (schema_name, table_only))
             else:
                 cursor.execute("""
                     SELECT column_name 
                     FROM information_schema.columns 
                     WHERE table_name = %s
                     ORDER BY ordinal_position
-                """, (table_name,))
+                """, (table_only,))
             columns = [row[0] for row in cursor.fetchall()]
         elif self.db_type.lower() == "mysql":
-            cursor.execute(f"DESCRIBE {GOLDEN_SOURCE_TABLE}")
+            cursor.execute(f"DESCRIBE {table_name}")
             columns = [row[0] for row in cursor.fetchall()]
         else:  # sqlite
-            cursor.execute(f"PRAGMA table_info({GOLDEN_SOURCE_TABLE})")
+            cursor.execute(f"PRAGMA table_info({table_name})")
             columns = [row[1] for row in cursor.fetchall()]
         
+        # Don't cache a miss - the table may simply not exist yet
+        if columns:
+            self._table_columns[table_name] = columns
+        return columns
+    
+    @_with_connection
+    def get_all_addresses(self) -> List[Dict[str, Any]]:
+        """Retrieve all addresses from the golden source table."""
+        cursor = self.connection.cursor()
+        
+        # Parse schema and table name if schema-qualified
+        table_parts = GOLDEN_SOURCE_TABLE.split('.')
+        if len(table_parts) == 2:
+            schema_name, table_name = table_parts
+        else:
+            schema_name = None
+            table_name = GOLDEN_SOURCE_TABLE
+        
+        # Try to get column names first
+        columns = self._get_table_columns(cursor, GOLDEN_SOURCE_TABLE)
+        
         # Fetch all addresses - properly quote the table name
         if schema_name:
             # Use proper quoting for schema.table
@@ -189,6 +430,8 @@ class GoldenSourceConnector:
         Retrieve filtered addresses from the golden source table based on search criteria.
         Only selects specific columns: address1, address2, Mailing City, state, zipcode
         
+        Results are cached for FILTER_CACHE_TTL seconds, keyed by the criteria used in the query.
+        
         Args:
             search_criteria: Dictionary with search terms (street_number, street_name, city, state, zip_code, search_terms)
             limit: Maximum number of addresses to return
@@ -196,6 +439,15 @@ class GoldenSourceConnector:
         Returns:
             List of address dictionaries with only the specified columns
         """
+        rows = self._query_filtered_addresses(search_criteria, limit)
+        
+        # Build fresh dictionaries so callers never mutate the cached rows
+        return [dict(zip(_FILTER_COLUMNS, row)) for row in rows]
+    
+    @cachedmethod(attrgetter('_filter_cache'), key=_filter_cache_key, lock=attrgetter('_filter_cache_lock'))
+    @_with_connection
+    def _query_filtered_addresses(self, search_criteria: dict, limit: int = 100) -> Tuple[tuple, ...]:
+        """Run the filtered golden source query and return the rows as an immutable tuple."""
         cursor = None
         try:
             cursor = self.connection.cursor()
@@ -211,8 +463,7 @@ class GoldenSourceConnector:
                 quoted_table = f'"{table_name}"'
             
             # Define the specific columns we want to select
-            target_columns = ['address1', 'address2', 'Mailing City', 'state', 'zipcode']
-            quoted_columns = ', '.join([f'"{col}"' for col in target_columns])
+            quoted_columns = ', '.join([f'"{col}"' for col in _FILTER_COLUMNS])
             
             # Build WHERE clause based on search criteria
             # Logic: state AND city AND (street_name OR street_type in address1)
@@ -280,15 +531,7 @@ class GoldenSourceConnector:
             print("-" * 60)
             
             cursor.execute(query, params)
-            rows = cursor.fetchall()
-            
-            # Convert to list of dictionaries using the target columns
-            addresses = []
-            for row in rows:
-                address_dict = {target_columns[i]: row[i] for i in range(len(target_columns))}
-                addresses.append(address_dict)
-            
-            return addresses
+            return tuple(tuple(row) for row in cursor.fetchall())
             
         except Exception as e:
             # With autocommit enabled, we don't need rollback, but log the error
@@ -307,28 +550,7 @@ class GoldenSourceConnector:
         - List of all column names in the table (in order)
         """
         # Get all column names from the Internal table
-        if self.db_type.lower() == "postgresql":
-            if schema_name:
-                cursor.execute("""
-                    SELECT column_name 
-                    FROM information_schema.columns 
-                    WHERE table_schema = %s AND table_name = %s
-                    ORDER BY ordinal_position
-                """, (schema_name, table_name))
-            else:
-                cursor.execute("""
-                    SELECT column_name 
-                    FROM information_schema.columns 
-                    WHERE table_name = %s
-                    ORDER BY ordinal_position
-                """, (table_name,))
-            columns = [row[0] for row in cursor.fetchall()]
-        elif self.db_type.lower() == "mysql":
-            cursor.execute(f"DESCRIBE {INTERNAL_MATCH_TABLE}")
-            columns = [row[0] for row in cursor.fetchall()]
-        else:  # sqlite
-            cursor.execute(f"PRAGMA table_info({INTERNAL_MATCH_TABLE})")
-            columns = [row[1] for row in cursor.fetchall()]
+        columns = self._get_table_columns(cursor, INTERNAL_MATCH_TABLE)
         
         # Convert to lowercase for case-insensitive matching
         columns_lower = {col.lower(): col for col in columns}
@@ -392,6 +614,7 @@ class GoldenSourceConnector:
         
         return mapping, columns
     
+    @_with_connection
     def get_internal_matches(self, golden_address: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         Query internal table to find addresses matching the golden source address.
@@ -439,7 +662,6 @@ class GoldenSourceConnector:
             
             # Extract street number and street name from address1
             # Typically address1 is in format like "123 Main St" or "456 Oak Avenue"
-            import re
             
             # Common street type suffixes (abbreviations and full names)
             street_types = [
@@ -546,6 +768,58 @@ class GoldenSourceConnector:
             if cursor:
                 cursor.close()
     
+    def _resolve_columns(self, sample_record: Dict[str, Any]) -> Dict[str, Optional[str]]:
+        """
+        Identify the columns used during consolidation (case-insensitive).
+        
+        Results are cached per set of record keys, since table schemas are stable within a session.
+        
+        Args:
+            sample_record: A record whose keys are the column names to inspect
+            
+        Returns:
+            Dictionary with keys: 'active_customer', 'media_type', 'exclusion', 'engineering',
+            'bad_type', 'city' (mapped to actual column names, or None if not found)
+        """
+        cache_key = frozenset(sample_record.keys())
+        columns = self._col_cache.get(cache_key)
+        if columns is not None:
+            return columns
+        
+        columns = {
+            'active_customer': None,
+            'media_type': None,
+            'exclusion': None,
+            'engineering': None,
+            'bad_type': None,
+            'city': None
+        }
+        
+        for key in sample_record.keys():
+            key_lower = key.lower()
+            if 'active' in key_lower and 'customer' in key_lower:
+                columns['active_customer'] = key
+            elif 'media' in key_lower or 'service' in key_lower:
+                columns['media_type'] = key
+            elif 'exclusion' in key_lower:
+                columns['exclusion'] = key
+            elif 'engineering' in key_lower and 'review' in key_lower:
+                columns['engineering'] = key
+            
+            # Bad Type and City keep the first matching column
+            if columns['bad_type'] is None:
+                key_compact = key_lower.replace(' ', '').replace('_', '')
+                if 'badtype' in key_compact or key.strip() == 'Bad Type':
+                    columns['bad_type'] = key
+            if columns['city'] is None and 'city' in key_lower:
+                columns['city'] = key
+        
+        # Record keys can come from request payloads, so keep the cache bounded
+        if len(self._col_cache) >= 256:
+            self._col_cache.clear()
+        self._col_cache[cache_key] = columns
+        return columns
+    
     def consolidate_internal_records(self, internal_matches: List[Dict[str, Any]], golden_source_address: Optional[Dict[str, Any]] = None, scenario: int = 1) -> Dict[str, Any]:
         """
         Consolidate multiple Internal records into a single record based on business rules.
@@ -572,11 +846,11 @@ class GoldenSourceConnector:
             return {"status": "error", "error": "No records to consolidate"}
         
         if len(internal_matches) == 1:
-            consolidated_record = internal_matches[0].copy()
+            consolidated_record = ChainMap({}, internal_matches[0])
             
             # Apply Golden Source address even for single record
             if golden_source_address:
-                print(f"\n[Single Record - Applying Golden Source Address]")
+                _log.debug("[Single Record - Applying Golden Source Address]")
                 
                 golden_address_fields = {
                     'address1': golden_source_address.get('address1'),
@@ -589,63 +863,48 @@ class GoldenSourceConnector:
                 city_value = golden_source_address.get('Mailing City') or golden_source_address.get('city')
                 
                 # Find the city column name in the consolidated record
-                city_col = None
-                for key in consolidated_record.keys():
-                    key_lower = key.lower()
-                    if 'city' in key_lower:
-                        city_col = key
-                        break
+                city_col = self._resolve_columns(consolidated_record)['city']
                 
                 # Update address fields in consolidated record
-                # Define flexible matching patterns for each field
-                field_patterns = {
-                    'address1': ['address1', 'address_1', 'address 1', 'address', 'street', 'street address', 'street_address'],
-                    'address2': ['address2', 'address_2', 'address 2', 'address line 2', 'address_line_2'],
-                    'state': ['state', 'st'],
-                    'zipcode': ['zipcode', 'zip_code', 'zip code', 'zip', 'postal', 'postalcode', 'postal_code'],
-                    'MasterAddress': ['MasterAddress', 'master_address', 'master address']
-                }
+                # Index the record's columns by normalized name once (first column wins)
+                norm_to_orig = {}
+                for col_name in consolidated_record.keys():
+                    norm_to_orig.setdefault(_normalize_column_name(col_name), col_name)
                 
                 for field_name, field_value in golden_address_fields.items():
                     if field_value is not None:
                         matching_col = None
-                        patterns = field_patterns.get(field_name, [field_name])
+                        patterns = _FIELD_PATTERNS_NORM.get(field_name, (_normalize_column_name(field_name),))
                         
-                        # Try to find matching column using various patterns
-                        for col_name in consolidated_record.keys():
-                            col_lower = col_name.lower().replace('_', ' ').strip()
-                            for pattern in patterns:
-                                pattern_normalized = pattern.lower().replace('_', ' ').strip()
-                                if col_lower == pattern_normalized:
-                                    matching_col = col_name
-                                    break
+                        # Try to find matching column using the patterns in priority order
+                        for pattern in patterns:
+                            matching_col = norm_to_orig.get(pattern)
                             if matching_col:
                                 break
                         
                         if matching_col:
                             old_value = consolidated_record[matching_col]
                             consolidated_record[matching_col] = field_value
-                            print(f"  Updated {matching_col}: '{old_value}' -> '{field_value}'")
+                            _log.debug("Updated %s: '%s' -> '%s'", matching_col, old_value, field_value)
                         else:
                             # Don't add new columns - only update existing ones
-                            print(f"  ⚠️  Warning: No matching column found for '{field_name}' (value: '{field_value}') - skipping")
-                            print(f"     Available columns: {list(consolidated_record.keys())}")
+                            _log.warning("No matching column found for '%s' (value: '%s') - skipping. Available columns: %s",
+                                         field_name, field_value, list(consolidated_record))
                 
                 # Update city field
                 if city_value and city_col:
                     old_city = consolidated_record[city_col]
                     consolidated_record[city_col] = city_value
-                    print(f"  Updated {city_col}: '{old_city}' -> '{city_value}'")
+                    _log.debug("Updated %s: '%s' -> '%s'", city_col, old_city, city_value)
                 elif city_value:
-                    print(f"  ⚠️  Warning: No matching city column found (value: '{city_value}') - skipping")
+                    _log.warning("No matching city column found (value: '%s') - skipping", city_value)
                 
-                print(f"  ✓ Applied Golden Source address to single record")
+                _log.debug("Applied Golden Source address to single record")
             
             # Filter out metadata fields (starting with _) before returning
-            filtered_consolidated_record = {k: v for k, v in consolidated_record.items() if not k.startswith('_')}
-            if len(filtered_consolidated_record) < len(consolidated_record):
-                removed_fields = [k for k in consolidated_record.keys() if k.startswith('_')]
-                print(f"  Filtered out metadata fields from single record: {removed_fields}")
+            filtered_consolidated_record, removed_fields = _split_metadata_fields(consolidated_record)
+            if removed_fields:
+                _log.debug("Filtered out metadata fields from single record: %s", removed_fields)
             
             return {"status": "success", "consolidated_record": filtered_consolidated_record, "message": "Single record, no consolidation needed"}
         
@@ -658,51 +917,44 @@ class GoldenSourceConnector:
         
         # Try to identify column names dynamically
         sample_record = internal_matches[0]
-        active_customer_col = None
-        media_type_col = None
-        exclusion_col = None
-        engineering_col = None
-        
-        # Find the relevant columns (case-insensitive)
-        for key in sample_record.keys():
-            key_lower = key.lower()
-            if 'active' in key_lower and 'customer' in key_lower:
-                active_customer_col = key
-            elif 'media' in key_lower or 'service' in key_lower:
-                media_type_col = key
-            elif 'exclusion' in key_lower:
-                exclusion_col = key
-            elif 'engineering' in key_lower and 'review' in key_lower:
-                engineering_col = key
-        
-        print(f"\n[Consolidation Debug]")
-        print(f"  Active Customer Column: {active_customer_col}")
-        print(f"  Media Type Column: {media_type_col}")
-        print(f"  Exclusion Column: {exclusion_col}")
-        print(f"  Engineering Review Column: {engineering_col}")
-        
-        # Categorize records
+        resolved_columns = self._resolve_columns(sample_record)
+        active_customer_col = resolved_columns['active_customer']
+        media_type_col = resolved_columns['media_type']
+        exclusion_col = resolved_columns['exclusion']
+        engineering_col = resolved_columns['engineering']
+        
+        _log.debug("[Consolidation Debug]")
+        _log.debug("Active Customer Column: %s", active_customer_col)
+        _log.debug("Media Type Column: %s", media_type_col)
+        _log.debug("Exclusion Column: %s", exclusion_col)
+        _log.debug("Engineering Review Column: %s", engineering_col)
+        
+        # Only the flag columns present in this record set are checked (resolved once, outside the loop)
+        flag_checks = [
+            (col, records)
+            for col, records in (
+                (active_customer_col, active_customer_records),    # Active customer
+                (exclusion_col, records_with_exclusion_y),         # Exclusion flag Y
+                (engineering_col, records_with_engineering_y)      # Engineering Review Y
+            )
+            if col
+        ]
+        
+        # Categorize records in a single pass
         for record in internal_matches:
-            # Check for active customer
-            if active_customer_col and str(record.get(active_customer_col, '')).strip().upper() in ['Y', 'YES', 'TRUE', '1']:
-                active_customer_records.append(record)
+            get = record.get
+            for col, records in flag_checks:
+                if str(get(col, '')).strip().upper() in _TRUTHY:
+                    records.append(record)
             
             # Check for Fiber Media
-            if media_type_col and 'FIBER' in str(record.get(media_type_col, '')).upper():
+            if media_type_col and 'FIBER' in str(get(media_type_col, '')).upper():
                 fiber_media_records.append(record)
-            
-            # Check for Exclusion flag Y
-            if exclusion_col and str(record.get(exclusion_col, '')).strip().upper() in ['Y', 'YES', 'TRUE', '1']:
-                records_with_exclusion_y.append(record)
-            
-            # Check for Engineering Review Y
-            if engineering_col and str(record.get(engineering_col, '')).strip().upper() in ['Y', 'YES', 'TRUE', '1']:
-                records_with_engineering_y.append(record)
         
-        print(f"  Active Customer Records: {len(active_customer_records)}")
-        print(f"  Fiber Media Records: {len(fiber_media_records)}")
-        print(f"  Exclusion Y Records: {len(records_with_exclusion_y)}")
-        print(f"  Engineering Review Y Records: {len(records_with_engineering_y)}")
+        _log.debug("Active Customer Records: %s", len(active_customer_records))
+        _log.debug("Fiber Media Records: %s", len(fiber_media_records))
+        _log.debug("Exclusion Y Records: %s", len(records_with_exclusion_y))
+        _log.debug("Engineering Review Y Records: %s", len(records_with_engineering_y))
         
         # Rule 5: If multiple Active Customers or multiple Fiber Media, prompt manual review
         if len(active_customer_records) > 1:
@@ -720,12 +972,14 @@ class GoldenSourceConnector:
             }
         
         # Start with the base record to consolidate
+        # (a ChainMap over the base keeps edits in its front dict instead of copying every column;
+        # it is flattened into a plain dict when metadata fields are filtered out below)
         consolidated_record = None
         
         # Rule 1: If there is a single Active Customer, use that as base
         if len(active_customer_records) == 1:
-            consolidated_record = active_customer_records[0].copy()
-            print(f"  Using Active Customer record as base")
+            consolidated_record = ChainMap({}, active_customer_records[0])
+            _log.debug("Using Active Customer record as base")
             
             # Rule 2: If any address has Fiber Media, update the active customer record
             if fiber_media_records and media_type_col:
@@ -733,50 +987,50 @@ class GoldenSourceConnector:
                 # Update to Fiber if current is Copper
                 if 'COPPER' in str(consolidated_record.get(media_type_col, '')).upper() or not consolidated_record.get(media_type_col):
                     consolidated_record[media_type_col] = fiber_value
-                    print(f"  Updated Media Type to: {fiber_value}")
+                    _log.debug("Updated Media Type to: %s", fiber_value)
         
         # Rule 4: If no Active Customer but there is Fiber Media, use Fiber record as base
         elif fiber_media_records:
-            consolidated_record = fiber_media_records[0].copy()
-            print(f"  Using Fiber Media record as base")
+            consolidated_record = ChainMap({}, fiber_media_records[0])
+            _log.debug("Using Fiber Media record as base")
         
         # If still no base record, use the first record
         if consolidated_record is None:
-            consolidated_record = internal_matches[0].copy()
-            print(f"  Using first record as base")
+            consolidated_record = ChainMap({}, internal_matches[0])
+            _log.debug("Using first record as base")
         
         # Rule 3: Update Exclusion and Engineering Review flags to 'Y' if any record has 'Y'
         if records_with_exclusion_y and exclusion_col:
             consolidated_record[exclusion_col] = 'Y'
-            print(f"  Set Exclusion flag to: Y")
+            _log.debug("Set Exclusion flag to: Y")
         elif exclusion_col and consolidated_record.get(exclusion_col) is None:
             consolidated_record[exclusion_col] = 'N'
         
         if records_with_engineering_y and engineering_col:
             consolidated_record[engineering_col] = 'Y'
-            print(f"  Set Engineering Review flag to: Y")
+            _log.debug("Set Engineering Review flag to: Y")
         elif engineering_col and consolidated_record.get(engineering_col) is None:
             consolidated_record[engineering_col] = 'N'
         
         # Concatenate Bad Type field from all records (for multiple matches)
         if len(internal_matches) > 1:
             # Find the Bad Type column (case-insensitive)
-            bad_type_col = None
-            for key in sample_record.keys():
-                key_lower = key.lower().replace(' ', '').replace('_', '')
-                if 'badtype' in key_lower or key.strip() == 'Bad Type':
-                    bad_type_col = key
-                    break
+            bad_type_col = resolved_columns['bad_type']
             
             if bad_type_col:
                 # Collect all unique non-empty Bad Type values from all records
+                # (first spelling wins; duplicates are detected case-insensitively)
                 bad_types = []
+                seen_lower = set()
                 for record in internal_matches:
                     bad_type_value = str(record.get(bad_type_col, '')).strip()
-                    if bad_type_value and bad_type_value.upper() not in ['NONE', 'N/A', 'NULL', '']:
-                        # Only add if not already in list (case-insensitive check)
-                        if bad_type_value not in bad_types and bad_type_value.lower() not in [bt.lower() for bt in bad_types]:
-                            bad_types.append(bad_type_value)
+                    if not bad_type_value:
+                        continue
+                    bad_type_lower = bad_type_value.lower()
+                    if bad_type_lower in _SKIP_BAD_TYPE or bad_type_lower in seen_lower:
+                        continue
+                    seen_lower.add(bad_type_lower)
+                    bad_types.append(bad_type_value)
                 
                 # Concatenate with semicolon separator
                 if bad_types:
@@ -787,19 +1041,19 @@ class GoldenSourceConnector:
                     if len(concatenated_bad_type) > max_length:
                         # Truncate and add ellipsis
                         concatenated_bad_type = concatenated_bad_type[:max_length-3] + '...'
-                        print(f"  ⚠️  Bad Type truncated to {max_length} characters")
+                        _log.warning("Bad Type truncated to %s characters", max_length)
                     
                     consolidated_record[bad_type_col] = concatenated_bad_type
-                    print(f"  Concatenated Bad Type from {len(internal_matches)} records: '{concatenated_bad_type}'")
+                    _log.debug("Concatenated Bad Type from %s records: '%s'", len(internal_matches), concatenated_bad_type)
                 else:
                     # No valid bad types found, keep the existing value or set to empty
                     if bad_type_col not in consolidated_record or not consolidated_record.get(bad_type_col):
                         consolidated_record[bad_type_col] = ''
-                    print(f"  No valid Bad Type values found across records")
+                    _log.debug("No valid Bad Type values found across records")
         
         # Rule: Use address fields from Golden Source if provided
         if golden_source_address:
-            print(f"\n  Applying Golden Source address fields to consolidated record...")
+            _log.debug("Applying Golden Source address fields to consolidated record...")
             
             # Define the address field mappings from Golden Source to Internal
             # Golden Source fields: address1, address2, Mailing City, state, zipcode
@@ -817,64 +1071,49 @@ class GoldenSourceConnector:
             city_value = golden_source_address.get('Mailing City') or golden_source_address.get('city')
             
             # Find the city column name in the consolidated record
-            city_col = None
-            for key in consolidated_record.keys():
-                key_lower = key.lower()
-                if 'city' in key_lower:
-                    city_col = key
-                    break
+            city_col = self._resolve_columns(consolidated_record)['city']
             
             # Update address fields in consolidated record
-            # Define flexible matching patterns for each field
-            field_patterns = {
-                'address1': ['address1', 'address_1', 'address 1', 'address', 'street', 'street address', 'street_address'],
-                'address2': ['address2', 'address_2', 'address 2', 'address line 2', 'address_line_2'],
-                'state': ['state', 'st'],
-                'zipcode': ['zipcode', 'zip_code', 'zip code', 'zip', 'postal', 'postalcode', 'postal_code'],
-                'MasterAddress': ['MasterAddress', 'master_address', 'master address']
-            }
+            # Index the record's columns by normalized name once (first column wins)
+            norm_to_orig = {}
+            for col_name in consolidated_record.keys():
+                norm_to_orig.setdefault(_normalize_column_name(col_name), col_name)
             
             for field_name, field_value in golden_address_fields.items():
                 if field_value is not None:
                     matching_col = None
-                    patterns = field_patterns.get(field_name, [field_name])
+                    patterns = _FIELD_PATTERNS_NORM.get(field_name, (_normalize_column_name(field_name),))
                     
-                    # Try to find matching column using various patterns
-                    for col_name in consolidated_record.keys():
-                        col_lower = col_name.lower().replace('_', ' ').strip()
-                        for pattern in patterns:
-                            pattern_normalized = pattern.lower().replace('_', ' ').strip()
-                            if col_lower == pattern_normalized:
-                                matching_col = col_name
-                                break
+                    # Try to find matching column using the patterns in priority order
+                    for pattern in patterns:
+                        matching_col = norm_to_orig.get(pattern)
                         if matching_col:
                             break
                     
                     if matching_col:
                         old_value = consolidated_record[matching_col]
                         consolidated_record[matching_col] = field_value
-                        print(f"    Updated {matching_col}: '{old_value}' -> '{field_value}'")
+                        _log.debug("Updated %s: '%s' -> '%s'", matching_col, old_value, field_value)
                     else:
                         # Don't add new columns - only update existing ones
-                        print(f"    ⚠️  Warning: No matching column found for '{field_name}' (value: '{field_value}') - skipping")
-                        print(f"       Available columns: {list(consolidated_record.keys())}")
+                        _log.warning("No matching column found for '%s' (value: '%s') - skipping. Available columns: %s",
+                                     field_name, field_value, list(consolidated_record))
             
             # Update city field
             if city_value and city_col:
                 old_city = consolidated_record[city_col]
                 consolidated_record[city_col] = city_value
-                print(f"    Updated {city_col}: '{old_city}' -> '{city_value}'")
+                _log.debug("Updated %s: '%s' -> '%s'", city_col, old_city, city_value)
             elif city_value:
                 # Don't add new columns - only update existing ones
-                print(f"    ⚠️  Warning: No matching city column found (value: '{city_value}') - skipping")
+                _log.warning("No matching city column found (value: '%s') - skipping", city_value)
             
-            print(f"  ✓ Successfully applied Golden Source address to consolidated record")
+            _log.debug("Successfully applied Golden Source address to consolidated record")
         
         # Filter out metadata fields (starting with _) before returning
-        filtered_consolidated_record = {k: v for k, v in consolidated_record.items() if not k.startswith('_')}
-        if len(filtered_consolidated_record) < len(consolidated_record):
-            removed_fields = [k for k in consolidated_record.keys() if k.startswith('_')]
-            print(f"  Filtered out metadata fields from consolidated record: {removed_fields}")
+        filtered_consolidated_record, removed_fields = _split_metadata_fields(consolidated_record)
+        if removed_fields:
+            _log.debug("Filtered out metadata fields from consolidated record: %s", removed_fields)
         
         return {
             "status": "success",
@@ -899,9 +1138,8 @@ class GoldenSourceConnector:
         print(f"  Input record keys: {list(golden_source_record.keys())}")
         
         # Filter out metadata fields (starting with _)
-        filtered_record = {k: v for k, v in golden_source_record.items() if not k.startswith('_')}
-        if len(filtered_record) < len(golden_source_record):
-            removed_fields = [k for k in golden_source_record.keys() if k.startswith('_')]
+        filtered_record, removed_fields = _split_metadata_fields(golden_source_record)
+        if removed_fields:
             print(f"  Filtered out metadata fields: {removed_fields}")
         
         # Define the mapping from Golden Source to Internal column names
@@ -942,6 +1180,69 @@ class GoldenSourceConnector:
         
         return internal_record
     
+    def _prepare_internal_update(self, consolidated_record: Dict[str, Any], scenario: int = 1,
+                                 current_datetime: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        Build the row to insert into internal_updates: metadata fields removed, scenario
+        fields ('Agent Action', 'tpi', 'datetime') added and varchar(50) fields truncated.
+        
+        Args:
+            consolidated_record: The consolidated address record to insert
+            scenario: Scenario identifier (1=Multiple Matches, 2=Single Match Mismatch, 3=No Internal Match)
+            current_datetime: Timestamp for the 'datetime' column. Defaults to now.
+            
+        Returns:
+            Dictionary of column name -> value ready for insert
+        """
+        # Filter out metadata fields (starting with _) before inserting
+        filtered_record, removed_fields = _split_metadata_fields(consolidated_record)
+        
+        # Add Agent Action and tpi based on scenario
+        scenario_data = _SCENARIO_META.get(scenario, _SCENARIO_META[1])
+        filtered_record[_AGENT_ACTION_KEY] = scenario_data[_AGENT_ACTION_KEY]
+        filtered_record[_TPI_KEY] = scenario_data[_TPI_KEY]
+        
+        # Add current datetime (includes both date and time)
+        if current_datetime is None:
+            current_datetime = datetime.now()
+        filtered_record[_DATETIME_KEY] = current_datetime
+        
+        print(f"\n[Scenario Metadata]")
+        print(f"  Scenario: {scenario}")
+        print(f"  Agent Action: {filtered_record['Agent Action']}")
+        print(f"  tpi: {filtered_record['tpi']}")
+        print(f"  datetime: {current_datetime.strftime('%Y-%m-%d %H:%M:%S')}")
+        
+        print(f"\n[Filtering Record for Insert]")
+        print(f"  Original fields: {list(consolidated_record.keys())}")
+        print(f"  Filtered fields: {list(filtered_record.keys())}")
+        print(f"  Removed fields: {removed_fields}")
+        
+        # Truncate string fields that might be too long for database constraints
+        # Common varchar(50) fields in the database
+        varchar_50_patterns = ['bad type', 'badtype', 'media', 'active customer', 
+                               'exclusion', 'engineering review', 'state', 'city']
+        
+        # Build a case-insensitive lookup
+        for field_key in list(filtered_record.keys()):
+            field_key_normalized = field_key.lower().replace(' ', '').replace('_', '')
+            
+            # Check if this field matches any of our varchar(50) patterns
+            for pattern in varchar_50_patterns:
+                pattern_normalized = pattern.replace(' ', '').replace('_', '')
+                if pattern_normalized in field_key_normalized or field_key_normalized in pattern_normalized:
+                    # Found a match - check and truncate if needed
+                    if filtered_record[field_key] is not None:
+                        field_value = str(filtered_record[field_key])
+                        if len(field_value) > 50:
+                            original_value = field_value
+                            filtered_record[field_key] = field_value[:47] + '...'
+                            print(f"  ⚠️  Truncated '{field_key}': '{original_value}' -> '{filtered_record[field_key]}'")
+                    break  # Move to next field after finding a match
+        
+        return filtered_record
+    
+    @_with_connection
     def push_to_internal_updates(self, consolidated_record: Dict[str, Any], scenario: int = 1) -> Dict[str, Any]:
         """
         Write a consolidated record to the team_cool_and_gang.internal_updates table.
@@ -975,66 +1276,7 @@ class GoldenSourceConnector:
                 table_name = updates_table
                 quoted_table = f'"{table_name}"'
             
-            # Filter out metadata fields (starting with _) before inserting
-            filtered_record = {k: v for k, v in consolidated_record.items() if not k.startswith('_')}
-            
-            # Add Agent Action and tpi based on scenario
-            scenario_mapping = {
-                1: {
-                    'Agent Action': 'Multiple Internal Matches (Consolidation Required)',
-                    'tpi': 20
-                },
-                2: {
-                    'Agent Action': 'Single Internal Match with MasterAddress Mismatch',
-                    'tpi': 10
-                },
-                3: {
-                    'Agent Action': 'No Internal Match (Golden Source Only)',
-                    'tpi': 5
-                }
-            }
-            
-            scenario_data = scenario_mapping.get(scenario, scenario_mapping[1])
-            filtered_record['Agent Action'] = scenario_data['Agent Action']
-            filtered_record['tpi'] = scenario_data['tpi']
-            
-            # Add current datetime (includes both date and time)
-            from datetime import datetime
-            current_datetime = datetime.now()
-            filtered_record['datetime'] = current_datetime
-            
-            print(f"\n[Scenario Metadata]")
-            print(f"  Scenario: {scenario}")
-            print(f"  Agent Action: {filtered_record['Agent Action']}")
-            print(f"  tpi: {filtered_record['tpi']}")
-            print(f"  datetime: {current_datetime.strftime('%Y-%m-%d %H:%M:%S')}")
-            
-            print(f"\n[Filtering Record for Insert]")
-            print(f"  Original fields: {list(consolidated_record.keys())}")
-            print(f"  Filtered fields: {list(filtered_record.keys())}")
-            print(f"  Removed fields: {[k for k in consolidated_record.keys() if k.startswith('_')]}")
-            
-            # Truncate string fields that might be too long for database constraints
-            # Common varchar(50) fields in the database
-            varchar_50_patterns = ['bad type', 'badtype', 'media', 'active customer', 
-                                   'exclusion', 'engineering review', 'state', 'city']
-            
-            # Build a case-insensitive lookup
-            for field_key in list(filtered_record.keys()):
-                field_key_normalized = field_key.lower().replace(' ', '').replace('_', '')
-                
-                # Check if this field matches any of our varchar(50) patterns
-                for pattern in varchar_50_patterns:
-                    pattern_normalized = pattern.replace(' ', '').replace('_', '')
-                    if pattern_normalized in field_key_normalized or field_key_normalized in pattern_normalized:
-                        # Found a match - check and truncate if needed
-                        if filtered_record[field_key] is not None:
-                            field_value = str(filtered_record[field_key])
-                            if len(field_value) > 50:
-                                original_value = field_value
-                                filtered_record[field_key] = field_value[:47] + '...'
-                                print(f"  ⚠️  Truncated '{field_key}': '{original_value}' -> '{filtered_record[field_key]}'")
-                        break  # Move to next field after finding a match
+            filtered_record = self._prepare_internal_update(consolidated_record, scenario)
             
             # Build INSERT statement with filtered fields
             columns = list(filtered_record.keys())
@@ -1058,6 +1300,10 @@ class GoldenSourceConnector:
             
             print(f"  ✓ Successfully inserted record into {updates_table}")
             
+            # Time saved now includes this record's tpi
+            self._time_saved_cache = (None, 0.0)
+            self.write_generation += 1
+            
             return {
                 "status": "success",
                 "message": f"Record successfully pushed to {updates_table}"
@@ -1082,6 +1328,106 @@ class GoldenSourceConnector:
             if cursor:
                 cursor.close()
     
+    @_with_connection
+    def push_to_internal_updates_batch(self, consolidated_records: List[Dict[str, Any]], scenario: int = 1) -> Dict[str, Any]:
+        """
+        Write many consolidated records to the team_cool_and_gang.internal_updates table.
+        
+        Each record gets the same scenario fields as push_to_internal_updates, with one 'datetime'
+        timestamp shared by the whole batch. Records are grouped by their set of columns so each
+        group shares one INSERT statement; on PostgreSQL each group is sent with psycopg2's
+        execute_batch (many rows per round trip).
+        
+        The whole batch is one transaction: if any insert fails nothing is written, so the batch
+        can be retried without duplicating rows.
+        
+        Args:
+            consolidated_records: The consolidated address records to insert
+            scenario: Scenario identifier (1=Multiple Matches, 2=Single Match Mismatch, 3=No Internal Match)
+            
+        Returns:
+            Dictionary with 'status' and 'message' or 'error'
+        """
+        if not consolidated_records:
+            return {"status": "success", "message": "No records to push"}
+        
+        conn = self.connection
+        # Pooled PostgreSQL connections run in autocommit mode (see _borrow_connection), which would
+        # commit every execute_batch page on its own; turn it off for the batch and restore it afterwards
+        restore_autocommit = self.db_type.lower() == "postgresql" and conn.autocommit
+        if restore_autocommit:
+            conn.autocommit = False
+        
+        cursor = None
+        try:
+            cursor = conn.cursor()
+            
+            # Parse the internal_updates table name
+            updates_table = "team_cool_and_gang.internal_updates"
+            table_parts = updates_table.split('.')
+            if len(table_parts) == 2:
+                schema_name, table_name = table_parts
+                quoted_table = f'"{schema_name}"."{table_name}"'
+            else:
+                table_name = updates_table
+                quoted_table = f'"{table_name}"'
+            
+            # Group rows by column list so each group can share one INSERT statement
+            # One timestamp for the whole batch
+            batch_datetime = datetime.now()
+            groups: Dict[Tuple[str, ...], List[List[Any]]] = {}
+            for consolidated_record in consolidated_records:
+                filtered_record = self._prepare_internal_update(consolidated_record, scenario, batch_datetime)
+                columns = tuple(filtered_record.keys())
+                groups.setdefault(columns, []).append(list(filtered_record.values()))
+            
+            print(f"\n[Batch Push to Internal Updates]")
+            print(f"  Records: {len(consolidated_records)} in {len(groups)} column group(s)")
+            
+            for columns, rows in groups.items():
+                placeholders = ', '.join([self._param] * len(columns))
+                quoted_columns = ', '.join([f'"{col}"' for col in columns])
+                insert_query = f'INSERT INTO {quoted_table} ({quoted_columns}) VALUES ({placeholders})'
+                
+                if self.db_type.lower() == "postgresql":
+                    from psycopg2.extras import execute_batch
+                    execute_batch(cursor, insert_query, rows, page_size=500)
+                else:
+                    cursor.executemany(insert_query, rows)
+            
+            conn.commit()
+            
+            print(f"  ✓ Successfully inserted {len(consolidated_records)} records into {updates_table}")
+            
+            # Time saved now includes these records' tpi
+            self._time_saved_cache = (None, 0.0)
+            self.write_generation += 1
+            
+            return {
+                "status": "success",
+                "message": f"{len(consolidated_records)} records successfully pushed to {updates_table}"
+            }
+            
+        except Exception as e:
+            error_msg = str(e)
+            print(f"  ✗ Error pushing batch to internal updates: {error_msg}")
+            
+            # Roll back the rows already inserted by this batch
+            try:
+                conn.rollback()
+            except Exception:
+                pass
+            
+            return {
+                "status": "error",
+                "error": f"Failed to push updates: {error_msg}"
+            }
+        finally:
+            if cursor:
+                cursor.close()
+            if restore_autocommit:
+                conn.autocommit = True
+    
     def fuzzy_match_addresses(self, input_address: str, threshold: Optional[float] = None) -> Dict[str, Any]:
         """
         Perform fuzzy matching search on MasterAddress column in both Golden Source and Internal tables.
@@ -1092,7 +1438,8 @@ class GoldenSourceConnector:
             threshold: Minimum similarity score (0-100). Defaults to FUZZY_MATCH_THRESHOLD from config.
             
         Returns:
-            Dictionary with 'golden_source_matches' and 'internal_matches', each containing list of matches
+            Dictionary with 'golden_source_matches' and 'internal_matches', each containing list of matches,
+            and 'search_errors' (table name -> error message for any table that couldn't be searched)
         """
         if threshold is None:
             threshold = FUZZY_MATCH_THRESHOLD
@@ -1113,14 +1460,34 @@ class GoldenSourceConnector:
         print(f"  2. Internal: {INTERNAL_MATCH_TABLE}")
         print(f"{'='*60}\n")
         
-        # Search Golden Source table
-        golden_source_matches = self._fuzzy_search_table(input_address, GOLDEN_SOURCE_MATCH_TABLE, threshold)
+        # A table whose search fails contributes no matches; the error is reported in 'search_errors'
+        # so callers can tell "no matches" from "couldn't search"
+        search_errors = {}
+        
+        def search_table(table_name):
+            try:
+                return self._fuzzy_search_table(input_address, table_name, threshold)
+            except Exception as e:
+                error_msg = str(e)
+                print(f"  ✗ Error searching {table_name}: {error_msg}")
+                search_errors[table_name] = error_msg
+                return []
+        
+        # Search Golden Source and Internal tables
+        # With a connection pool the Golden Source search runs on a worker thread (its own connection)
+        # while this thread searches the Internal table; the waits and the scoring overlap
+        if self._search_executor is not None:
+            golden_source_future = self._search_executor.submit(search_table, GOLDEN_SOURCE_MATCH_TABLE)
+            internal_matches = search_table(INTERNAL_MATCH_TABLE)
+            golden_source_matches = golden_source_future.result()
+        else:
+            golden_source_matches = search_table(GOLDEN_SOURCE_MATCH_TABLE)
+            internal_matches = search_table(INTERNAL_MATCH_TABLE)
+        
         for match in golden_source_matches:
             match['_source_table'] = GOLDEN_SOURCE_MATCH_TABLE
             match['_source_type'] = 'golden_source'
         
-        # Search Internal table
-        internal_matches = self._fuzzy_search_table(input_address, INTERNAL_MATCH_TABLE, threshold)
         for match in internal_matches:
             match['_source_table'] = INTERNAL_MATCH_TABLE
             match['_source_type'] = 'internal'
@@ -1155,7 +1522,8 @@ class GoldenSourceConnector:
         return {
             'golden_source_matches': golden_source_matches,
             'internal_matches': internal_matches,
-            'total_matches': len(golden_source_matches) + len(internal_matches)
+            'total_matches': len(golden_source_matches) + len(internal_matches),
+            'search_errors': search_errors
         }
     
     def _extract_street_number(self, address: str) -> Optional[str]:
@@ -1168,9 +1536,8 @@ class GoldenSourceConnector:
         Returns:
             Street number as string, or None if not found
         """
-        import re
         # Match leading digits, possibly followed by letter (e.g., "123A")
-        match = re.match(r'^(\d+[A-Za-z]?)', address.strip())
+        match = _STREETNUM.match(address.strip())
         if match:
             return match.group(1).upper()
         return None
@@ -1185,23 +1552,340 @@ class GoldenSourceConnector:
         Returns:
             Cleaned address string
         """
-        import re
-        
-        # Remove common state abbreviations (2 letter codes at the end)
-        # Pattern: Remove state codes like "FL", "NY", "CA", etc.
-        address = re.sub(r'\b[A-Z]{2}\b\s*$', '', address)
-        address = re.sub(r',\s*[A-Z]{2}\b', '', address)
-        
-        # Remove zip codes (5 digits or 5+4 format)
-        address = re.sub(r'\b\d{5}(-\d{4})?\b', '', address)
+        # Remove state codes like "FL", "NY", "CA" (at the end or after a comma)
+        # and zip codes (5 digits or 5+4 format) in a single pass
+        address = _STATE_ZIP.sub('', address)
         
         # Remove extra whitespace and commas
-        address = re.sub(r'\s+', ' ', address)
-        address = re.sub(r',+', ',', address)
+        address = _WS.sub(' ', address)
+        address = _COMMAS.sub(',', address)
         address = address.strip(' ,')
         
         return address
     
+    def _open_scan_cursor(self):
+        """
+        Open a cursor for streaming large result sets.
+        
+        PostgreSQL uses a named (server-side) cursor so rows arrive in batches instead of
+        being materialized client-side all at once. WITH HOLD keeps it usable in autocommit mode.
+        """
+        if self.db_type.lower() == "postgresql":
+            cursor = self.connection.cursor(name='fuzzy_scan', withhold=True)
+            cursor.itersize = _SCAN_BATCH_SIZE
+            return cursor
+        return self.connection.cursor()
+    
+    def _open_row_cursor(self):
+        """
+        Open a cursor for fetching full rows.
+        
+        PostgreSQL uses RealDictCursor so rows arrive as dicts keyed by column name,
+        skipping the per-row dict construction. Other drivers return tuples.
+        
+        Returns:
+            Tuple of (cursor, True if rows are already dicts)
+        """
+        if self.db_type.lower() == "postgresql":
+            from psycopg2.extras import RealDictCursor
+            return self.connection.cursor(cursor_factory=RealDictCursor), True
+        return self.connection.cursor(), False
+    
+    def _get_fuzzy_candidates(self, table_name: str, quoted_table: str, street_number: str,
+                              similar_to: Optional[str] = None) -> Tuple[List[Any], List[str], np.ndarray, np.ndarray, Dict[Tuple[str, float], Dict[Any, Tuple[float, str]]]]:
+        """
+        Get the distinct MasterAddress values in a table that share a street number,
+        along with their cleaned and canonical (sorted-token) forms and canonical lengths.
+        
+        Preloaded tables are answered from their in-memory index (reloaded once it's older than
+        FUZZY_CORPUS_CACHE_TTL). Otherwise the corpus doesn't change between queries, so scan results
+        are cached per (table, street number) for FUZZY_CORPUS_CACHE_TTL seconds (up to
+        FUZZY_CORPUS_CACHE_SIZE street numbers); repeat searches skip the database scan entirely.
+        Each corpus also carries a score cache, so it expires together with the addresses it scored.
+        Trigram-prefiltered candidates are specific to one input address and aren't cached.
+        
+        Args:
+            table_name: Name of the table to search
+            quoted_table: Quoted (schema-qualified) table name for SQL
+            street_number: Street number candidates must share
+            similar_to: Optional input address for the pg_trgm prefilter (see _load_fuzzy_candidates)
+            
+        Returns:
+            Tuple of (raw MasterAddress values, cleaned addresses, canonical addresses,
+            canonical lengths - aligned, score cache keyed by (canonical input, threshold))
+        """
+        if similar_to is not None:
+            # Trigram candidates are specific to this input address, so they're never cached
+            candidate_addresses, cleaned_candidates = self._load_fuzzy_candidates(table_name, quoted_table, street_number, similar_to)
+            return self._build_corpus(candidate_addresses, cleaned_candidates)
+        
+        preloaded = self._preloaded_tables.get(table_name)
+        if preloaded is not None:
+            if time.monotonic() - preloaded[0] >= FUZZY_CORPUS_CACHE_TTL:
+                # One request reloads the index; concurrent ones keep using the current one meanwhile
+                self.reload_if_stale(table_name)
+                preloaded = self._preloaded_tables.get(table_name, preloaded)
+            corpus = preloaded[1].get(street_number)
+            # Preloaded tables hold every street number, so a missing bucket means no candidates
+            return corpus if corpus is not None else self._build_corpus([], [])
+        
+        cache_key = (table_name, street_number)
+        with self._corpus_cache_lock:
+            corpus = self._corpus_cache.get(cache_key)
+        if corpus is not None:
+            print(f"  Using cached candidates for street number {street_number} ({len(corpus[0])} addresses)")
+            return corpus
+        
+        candidate_addresses, cleaned_candidates = self._load_fuzzy_candidates(table_name, quoted_table, street_number)
+        corpus = self._build_corpus(candidate_addresses, cleaned_candidates)
+        with self._corpus_cache_lock:
+            self._corpus_cache[cache_key] = corpus
+        return corpus
+    
+    def _build_corpus(self, candidate_addresses: List[Any], cleaned_candidates: List[str]) -> Tuple:
+        """
+        Derive the canonical forms and lengths for a candidate corpus.
+        
+        Returns:
+            Tuple of (raw MasterAddress values, cleaned addresses, canonical addresses,
+            canonical lengths, empty score cache)
+        """
+        # Canonical forms live in a numpy object array so survivors can be selected by index array
+        # and handed to cdist without building a new list per query
+        canonical_candidates = np.empty(len(cleaned_candidates), dtype=object)
+        canonical_candidates[:] = [_canon(cleaned) for cleaned in cleaned_candidates]
+        canonical_lengths = np.fromiter(map(len, canonical_candidates), dtype=np.int64, count=len(canonical_candidates))
+        return (candidate_addresses, cleaned_candidates, canonical_candidates, canonical_lengths, {})
+    
+    def _preload_lock(self, table_name: str) -> threading.Lock:
+        """The lock serializing (re)loads of one table's preloaded index."""
+        with self._preload_locks_guard:
+            return self._preload_locks.setdefault(table_name, threading.Lock())
+    
+    def preload_fuzzy_index(self, table_name: str) -> int:
+        """
+        Load every MasterAddress in a table into an in-memory index, bucketed by street number.
+        
+        Searches against a preloaded table skip the per-street-number database scan; street numbers
+        with no bucket simply have no candidates. The index is reloaded on first use after
+        FUZZY_CORPUS_CACHE_TTL seconds (see reload_if_stale).
+        
+        Args:
+            table_name: Name of the table to index
+            
+        Returns:
+            Number of distinct addresses indexed
+        """
+        with self._preload_lock(table_name):
+            return self._load_preloaded_index(table_name)
+    
+    @_with_connection
+    def _load_preloaded_index(self, table_name: str) -> int:
+        """Scan a table and swap in its new preloaded index (callers hold the table's preload lock)."""
+        table_parts = table_name.split('.')
+        if len(table_parts) == 2:
+            quoted_table = f'"{table_parts[0]}"."{table_parts[1]}"'
+        else:
+            quoted_table = f'"{table_name}"'
+        
+        print(f"\nPreloading fuzzy-match index for {table_name}...")
+        
+        buckets: Dict[str, Tuple[List[Any], List[str]]] = {}
+        seen_addresses = set()
+        # Local aliases for the per-row loop
+        extract_street_number = self._extract_street_number
+        clean_address = self._clean_address_for_fuzzy_match
+        add_seen = seen_addresses.add
+        for raw_master_address in self._scan_master_addresses(quoted_table):
+            if raw_master_address in seen_addresses:
+                continue
+            add_seen(raw_master_address)
+            
+            master_address = str(raw_master_address).strip()
+            street_number = extract_street_number(master_address) if master_address else None
+            if not street_number:
+                continue
+            
+            candidate_addresses, cleaned_candidates = buckets.setdefault(street_number, ([], []))
+            candidate_addresses.append(raw_master_address)
+            cleaned_candidates.append(clean_address(master_address))
+        
+        index = {
+            street_number: self._build_corpus(candidate_addresses, cleaned_candidates)
+            for street_number, (candidate_addresses, cleaned_candidates) in buckets.items()
+        }
+        # Swap in the whole index at once; searches already holding the old one finish with it
+        self._preloaded_tables[table_name] = (time.monotonic(), index)
+        
+        indexed = sum(len(candidate_addresses) for candidate_addresses, _ in buckets.values())
+        print(f"  Indexed {indexed} addresses across {len(buckets)} street numbers")
+        return indexed
+    
+    def _scan_master_addresses(self, quoted_table: str):
+        """
+        Yield every non-empty MasterAddress in a table, for building the preloaded index.
+        
+        PostgreSQL streams the column with COPY ... TO STDOUT, which skips the per-row
+        cursor protocol overhead of a full-table fetch. COPY can't run while a psycopg2 wait
+        callback is installed (psycogreen under gunicorn's gevent workers), so then, like other
+        databases, the column is read through the scan cursor in batches.
+        
+        Args:
+            quoted_table: Quoted (schema-qualified) table name for SQL
+        """
+        select_query = (
+            f'SELECT "MasterAddress" FROM {quoted_table} '
+            f'WHERE "MasterAddress" IS NOT NULL AND "MasterAddress" != \'\''
+        )
+        
+        if self.db_type.lower() == "postgresql" and not self._has_wait_callback():
+            buffer = io.StringIO()
+            cursor = self.connection.cursor()
+            try:
+                cursor.copy_expert(f'COPY ({select_query}) TO STDOUT WITH CSV', buffer)
+            finally:
+                cursor.close()
+            buffer.seek(0)
+            for row in csv.reader(buffer):
+                if row:
+                    yield row[0]
+            return
+        
+        scan_cursor = self._open_scan_cursor()
+        try:
+            scan_cursor.execute(select_query)
+            while True:
+                batch = scan_cursor.fetchmany(_SCAN_BATCH_SIZE)
+                if not batch:
+                    break
+                for (raw_master_address,) in batch:
+                    yield raw_master_address
+        finally:
+            scan_cursor.close()
+    
+    @staticmethod
+    def _has_wait_callback() -> bool:
+        """Whether psycopg2 has a wait callback installed (copy_expert raises ProgrammingError then)."""
+        from psycopg2.extensions import get_wait_callback
+        return get_wait_callback() is not None
+    
+    def reload_if_stale(self, table_name: Optional[str] = None):
+        """
+        Reload preloaded fuzzy-match indexes older than FUZZY_CORPUS_CACHE_TTL seconds.
+        
+        Searches call this when they find their table's index expired. Only one reload per table
+        runs at a time: if one is already in progress this returns immediately and the caller
+        keeps using the current index. A failed reload also keeps the current index (a later
+        search retries it).
+        
+        Args:
+            table_name: Table to check, or None for every preloaded table
+        """
+        table_names = [table_name] if table_name is not None else list(self._preloaded_tables)
+        for name in table_names:
+            lock = self._preload_lock(name)
+            if not lock.acquire(blocking=False):
+                continue
+            try:
+                # Re-check under the lock: another reload may have just finished
+                preloaded = self._preloaded_tables.get(name)
+                if preloaded is None or time.monotonic() - preloaded[0] < FUZZY_CORPUS_CACHE_TTL:
+                    continue
+                try:
+                    self._load_preloaded_index(name)
+                except Exception as e:
+                    print(f"  ⚠️  Reloading fuzzy-match index for {name} failed, keeping the current one: {e}")
+            finally:
+                lock.release()
+    
+    def _load_fuzzy_candidates(self, table_name: str, quoted_table: str, street_number: str,
+                               similar_to: Optional[str] = None) -> Tuple[List[Any], List[str]]:
+        """
+        Scan a table for the distinct MasterAddress values whose street number matches exactly.
+        
+        Only the MasterAddress column is streamed (SQL has no built-in fuzzy matching, but the
+        other columns aren't needed to score). On PostgreSQL the exact street number comparison
+        runs in the WHERE clause, so only candidates come back. Other databases use a LIKE prefix
+        on the street number's digits and the exact comparison is applied here.
+        
+        When similar_to is given (PostgreSQL with pg_trgm), only the FUZZY_TRGM_LIMIT addresses
+        most trigram-similar to it are returned, for rapidfuzz to rescore.
+        
+        Returns:
+            Tuple of (raw MasterAddress values, cleaned addresses aligned with them)
+        """
+        exact_in_sql = self.db_type.lower() == "postgresql"
+        if exact_in_sql:
+            street_number_filter = f'{_STREET_NUMBER_SQL} = %s'
+            scan_params = [street_number]
+        else:
+            street_number_filter = f'"MasterAddress" LIKE {self._param}'
+            scan_params = [f'{street_number.rstrip("ABCDEFGHIJKLMNOPQRSTUVWXYZ")}%']
+        scan_query = (
+            f'SELECT "MasterAddress" FROM {quoted_table} '
+            f'WHERE "MasterAddress" IS NOT NULL AND "MasterAddress" != \'\' AND {street_number_filter}'
+        )
+        if similar_to is not None:
+            # pg_trgm candidate generation: "%%" is the similarity operator (escaped for the driver)
+            scan_query += ' AND "MasterAddress" %% %s ORDER BY "MasterAddress" <-> %s LIMIT %s'
+            scan_params += [similar_to, similar_to, FUZZY_TRGM_LIMIT]
+        
+        print(f"\nQuerying {table_name}...")
+        print(f"Query: {scan_query}")
+        print(f"Params: {scan_params}")
+        
+        candidate_addresses = []  # Raw MasterAddress values
+        cleaned_candidates = []  # Cleaned addresses, aligned with candidate_addresses
+        seen_addresses = set()
+        records_scanned = 0
+        street_number_matches = 0
+        # Local aliases for the per-row loop
+        extract_street_number = self._extract_street_number
+        clean_address = self._clean_address_for_fuzzy_match
+        add_seen = seen_addresses.add
+        add_candidate = candidate_addresses.append
+        add_cleaned = cleaned_candidates.append
+        
+        scan_cursor = self._open_scan_cursor()
+        try:
+            scan_cursor.execute(scan_query, scan_params)
+            
+            # Pull rows in batches so memory stays flat and every driver avoids per-row fetches
+            while True:
+                batch = scan_cursor.fetchmany(_SCAN_BATCH_SIZE)
+                if not batch:
+                    break
+                
+                for (raw_master_address,) in batch:
+                    records_scanned += 1
+                    master_address = str(raw_master_address).strip()
+                    
+                    if not master_address:
+                        continue
+                    
+                    # Street numbers must match exactly (already enforced by the query on PostgreSQL)
+                    if not exact_in_sql and extract_street_number(master_address) != street_number:
+                        continue
+                    
+                    street_number_matches += 1
+                    
+                    # Duplicate addresses only need to be scored once
+                    if raw_master_address in seen_addresses:
+                        continue
+                    add_seen(raw_master_address)
+                    
+                    # Clean master address (remove zip and state)
+                    add_candidate(raw_master_address)
+                    add_cleaned(clean_address(master_address))
+        finally:
+            scan_cursor.close()
+        
+        print(f"  Fetched {records_scanned} records with MasterAddress")
+        print(f"  Records with matching street number ({street_number}): {street_number_matches}")
+        
+        return candidate_addresses, cleaned_candidates
+    
+    @_with_connection
     def _fuzzy_search_table(self, input_address: str, table_name: str, threshold: float) -> List[Dict[str, Any]]:
         """
         Search a single table for fuzzy matches on MasterAddress column.
@@ -1214,6 +1898,7 @@ class GoldenSourceConnector:
             
         Returns:
             List of matching address dictionaries with similarity scores
+            (database errors propagate; fuzzy_match_addresses reports them per table)
         """
         cursor = None
         try:
@@ -1230,28 +1915,7 @@ class GoldenSourceConnector:
                 quoted_table = f'"{table_only}"'
             
             # First, check if MasterAddress column exists in the table
-            if self.db_type.lower() == "postgresql":
-                if schema_name:
-                    cursor.execute("""
-                        SELECT column_name 
-                        FROM information_schema.columns 
-                        WHERE table_schema = %s AND table_name = %s
-                        ORDER BY ordinal_position
-                    """, (schema_name, table_only))
-                else:
-                    cursor.execute("""
-                        SELECT column_name 
-                        FROM information_schema.columns 
-                        WHERE table_name = %s
-                        ORDER BY ordinal_position
-                    """, (table_only,))
-                columns = [row[0] for row in cursor.fetchall()]
-            elif self.db_type.lower() == "mysql":
-                cursor.execute(f"DESCRIBE {table_name}")
-                columns = [row[0] for row in cursor.fetchall()]
-            else:  # sqlite
-                cursor.execute(f"PRAGMA table_info({table_name})")
-                columns = [row[1] for row in cursor.fetchall()]
+            columns = self._get_table_columns(cursor, table_name)
             
             # Check if MasterAddress exists
             if 'MasterAddress' not in columns:
@@ -1271,59 +1935,91 @@ class GoldenSourceConnector:
             cleaned_input = self._clean_address_for_fuzzy_match(input_address)
             print(f"  Cleaned input address: {cleaned_input}")
             
-            # Fetch all records with MasterAddress
-            # We need to fetch all and do fuzzy matching in Python since SQL doesn't have built-in fuzzy matching
-            query = f'SELECT * FROM {quoted_table} WHERE "MasterAddress" IS NOT NULL AND "MasterAddress" != \'\''
-            
-            print(f"\nQuerying {table_name}...")
-            print(f"Query: {query}")
-            
-            cursor.execute(query)
-            rows = cursor.fetchall()
-            
-            print(f"  Fetched {len(rows)} records with MasterAddress")
-            
-            # Perform fuzzy matching on each record
-            matches = []
-            street_number_matches = 0
-            
-            for row in rows:
-                row_dict = {columns[i]: row[i] for i in range(len(columns))}
-                master_address = str(row_dict.get('MasterAddress', '')).strip()
-                
-                if not master_address:
-                    continue
+            # Pass 1: candidate MasterAddresses sharing the input's street number (cached per table)
+            # Optionally narrow candidates in the database with pg_trgm before scoring
+            similar_to = input_address if FUZZY_TRGM_PREFILTER and self.db_type.lower() == "postgresql" else None
+            candidate_addresses, cleaned_candidates, canonical_candidates, canonical_lengths, score_cache = self._get_fuzzy_candidates(
+                table_name, quoted_table, input_street_number, similar_to
+            )
+            
+            # Score all candidates in one rapidfuzz cdist call (a single C loop, no per-candidate Python calls;
+            # cdist only parallelizes across query rows, so workers would add nothing for one query)
+            # fuzz.ratio on sorted-token forms is token_sort_ratio (handles word order differences)
+            # without re-tokenizing the candidates on every query. A token-overlap (Jaccard) prefilter
+            # isn't used: typos split tokens, e.g. "10 main st clearwater" vs "10 mian str clearwatr"
+            # share 1 of 7 tokens yet score 90.5
+            # Repeat queries against the same cached corpus reuse their scores
+            canonical_input = _canon(cleaned_input)
+            score_key = (canonical_input, threshold)
+            scored_addresses = score_cache.get(score_key)  # Raw MasterAddress -> (score, cleaned address)
+            if scored_addresses is None:
+                scored_addresses = {}
                 
-                # Extract street number from master address
-                master_street_number = self._extract_street_number(master_address)
+                # fuzz.ratio can't exceed 200 * min(la, lb) / (la + lb), so candidates whose length
+                # alone keeps them under the threshold are never scored (small slack for float rounding)
+                input_length = len(canonical_input)
+                possible = np.nonzero(
+                    200.0 * np.minimum(canonical_lengths, input_length)
+                    >= threshold * (canonical_lengths + input_length) - 1e-6
+                )[0]
                 
-                # Street numbers must match exactly
-                if master_street_number != input_street_number:
-                    continue
-                
-                street_number_matches += 1
-                
-                # Clean master address (remove zip and state)
-                cleaned_master = self._clean_address_for_fuzzy_match(master_address)
+                if len(possible):
+                    scores = process.cdist(
+                        [canonical_input],
+                        canonical_candidates[possible],
+                        scorer=fuzz.ratio,
+                        score_cutoff=threshold,
+                        dtype=np.float64
+                    )[0]
+                    for pos in np.nonzero(scores >= threshold)[0]:
+                        idx = possible[pos]
+                        scored_addresses[candidate_addresses[idx]] = (float(scores[pos]), cleaned_candidates[idx])
                 
-                # Calculate similarity score using rapidfuzz on cleaned addresses
-                # Using token_sort_ratio which handles word order differences
-                similarity = fuzz.token_sort_ratio(cleaned_input.lower(), cleaned_master.lower())
+                if len(score_cache) >= 1024:
+                    score_cache.clear()
+                score_cache[score_key] = scored_addresses
+            else:
+                print(f"  Using cached scores ({len(scored_addresses)} above threshold)")
+            
+            # Pass 2: load full rows only for the addresses above the threshold
+            matches = []
+            if scored_addresses:
+                # On PostgreSQL the street number filter lets the expression index (README.md
+                # "Recommended Indexes") find the rows instead of a sequential scan for the IN list
+                street_number_filter = ''
+                street_number_params = []
+                if self.db_type.lower() == "postgresql":
+                    street_number_filter = f' AND {_STREET_NUMBER_SQL} = %s'
+                    street_number_params = [input_street_number]
+                matched_addresses = list(scored_addresses.keys())
+                rows = []
+                row_cursor, rows_are_dicts = self._open_row_cursor()
+                try:
+                    for start in range(0, len(matched_addresses), _ROW_FETCH_BATCH_SIZE):
+                        batch = matched_addresses[start:start + _ROW_FETCH_BATCH_SIZE]
+                        placeholders = ', '.join([self._param] * len(batch))
+                        row_cursor.execute(
+                            f'SELECT * FROM {quoted_table} '
+                            f'WHERE "MasterAddress" IN ({placeholders}){street_number_filter}',
+                            batch + street_number_params
+                        )
+                        rows.extend(row_cursor.fetchall())
+                    # Column names in the order this SELECT * returned them
+                    row_columns = [desc[0] for desc in row_cursor.description]
+                finally:
+                    row_cursor.close()
                 
-                if similarity >= threshold:
+                for row in rows:
+                    row_dict = row if rows_are_dicts else dict(zip(row_columns, row))
+                    similarity, cleaned_master = scored_addresses[row_dict['MasterAddress']]
                     row_dict['_similarity_score'] = similarity
                     row_dict['_cleaned_address'] = cleaned_master  # For debugging
                     matches.append(row_dict)
             
-            print(f"  Records with matching street number ({input_street_number}): {street_number_matches}")
             print(f"  Found {len(matches)} matches above {threshold}% threshold (after fuzzy match)")
             
             return matches
             
-        except Exception as e:
-            error_msg = str(e)
-            print(f"  ✗ Error searching {table_name}: {error_msg}")
-            return []
         finally:
             if cursor:
                 cursor.close()
@@ -1332,9 +2028,24 @@ class GoldenSourceConnector:
         """
         Calculate the total time saved by the system based on tpi values in internal_updates table.
         
+        Successful results are reused for TIME_SAVED_CACHE_TTL seconds (the UI polls this);
+        pushing updates invalidates the cached value.
+        
         Returns:
             Dictionary with 'hours_saved' (float) and 'status'
         """
+        cached_result, expires_at = self._time_saved_cache
+        if cached_result is not None and time.monotonic() < expires_at:
+            return dict(cached_result)
+        
+        result = self._query_time_saved()
+        if result['status'] == 'success':
+            self._time_saved_cache = (result, time.monotonic() + TIME_SAVED_CACHE_TTL)
+        return dict(result)
+    
+    @_with_connection
+    def _query_time_saved(self) -> Dict[str, Any]:
+        """Run the SUM(tpi) query behind get_time_saved."""
         cursor = None
         try:
             cursor = self.connection.cursor()
@@ -1373,8 +2084,27 @@ class GoldenSourceConnector:
             if cursor:
                 cursor.close()
     
+    def invalidate_caches(self):
+        """Drop cached query results (e.g. after the source tables are refreshed)."""
+        with self._filter_cache_lock:
+            self._filter_cache.clear()
+        self._col_cache.clear()
+        self._table_columns.clear()
+        with self._corpus_cache_lock:
+            self._corpus_cache.clear()
+        # Keep preloaded tables in preload mode: mark their indexes expired so the next search
+        # against each one reloads it (see reload_if_stale)
+        for table_name, (_, index) in list(self._preloaded_tables.items()):
+            self._preloaded_tables[table_name] = (float('-inf'), index)
+        self._time_saved_cache = (None, 0.0)
+        self.write_generation += 1
+    
     def close(self):
-        """Close the database connection."""
-        if self.connection:
-            self.connection.close()
+        """Close the database connection (or every pooled connection)."""
+        if self._search_executor is not None:
+            self._search_executor.shutdown(wait=True)
+        if self._pool is not None:
+            self._pool.closeall()
+        elif self._connection:
+            self._connection.close()
 
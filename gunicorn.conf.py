@@ -0,0 +1,48 @@
+"""Gunicorn configuration for the OneTrueAddress web app.
+
+Requests spend most of their time waiting on the database and the Claude API, so workers
+use gevent: each worker process serves many requests concurrently instead of one at a time.
+"""
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '5000')}"
+
+# gevent workers: gunicorn runs gevent's monkey.patch_all() in each worker before the app
+# is imported, so socket/ssl/time in web_app and its dependencies are already cooperative
+worker_class = "gevent"
+workers = int(os.getenv("WEB_CONCURRENCY", str(multiprocessing.cpu_count() * 2 + 1)))
+worker_connections = int(os.getenv("GUNICORN_WORKER_CONNECTIONS", "1000"))
+
+
+def post_fork(server, worker):
+    """Let psycopg2 yield to other greenlets while it waits on the database."""
+    from psycogreen.gevent import patch_psycopg
+    patch_psycopg()
+
+
+def post_worker_init(worker):
+    """Start creating the address agent as the worker comes up, so the first /match doesn't pay for it.
+    
+    The agent is built per worker rather than with preload_app: its database pool and API client
+    must not be shared across forked processes. It's built in the background (a greenlet, since
+    threading is monkey-patched) so a long FUZZY_PRELOAD_INDEX load doesn't delay the worker's
+    first heartbeat past the gunicorn timeout; requests arriving meanwhile wait in get_agent().
+    """
+    import threading
+    from web_app import get_agent
+    
+    def warm_up():
+        try:
+            get_agent()
+        except Exception as e:
+            # Leave it to the first request to retry (and report the error)
+            worker.log.warning(f"Address agent warm-up failed: {e}")
+    
+    threading.Thread(target=warm_up, name="agent-warm-up", daemon=True).start()
+
+
+def worker_exit(server, worker):
+    """Close the worker's database pool and API client when it shuts down (atexit isn't guaranteed to run)."""
+    from web_app import cleanup_agent
+    cleanup_agent()
@@ -0,0 +1,67 @@
+"""Caching of get_filtered_addresses reads (run: python -m unittest discover tests)."""
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import golden_source
+
+
+ROWS = [("10 Main St", None, "Clearwater", "FL", "33755")]
+CRITERIA = {"state": "FL", "city": "Clearwater", "street_name": "Main", "street_type": "St"}
+
+
+class FilteredAddressesCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        patches = [
+            mock.patch.object(golden_source, "GOLDEN_SOURCE_DB_TYPE", "sqlite"),
+            mock.patch.object(golden_source, "GOLDEN_SOURCE_DATABASE", ":memory:"),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+        self.connector = golden_source.GoldenSourceConnector()
+        self.addCleanup(self.connector.close)
+        # The filter query is PostgreSQL-specific (::text ILIKE), so stand in a connection for it
+        self.connection = mock.MagicMock()
+        self.cursor = self.connection.cursor.return_value
+        self.cursor.fetchall.return_value = ROWS
+        patch = mock.patch.object(self.connector, "_connection", self.connection)
+        patch.start()
+        self.addCleanup(patch.stop)
+
+    def test_repeat_criteria_are_served_from_the_cache(self):
+        first = self.connector.get_filtered_addresses(dict(CRITERIA, search_terms=["main"]))
+        # Criteria the query doesn't use (street_number, search_terms) don't change the key
+        second = self.connector.get_filtered_addresses(dict(CRITERIA, street_number="10", search_terms=["st"]))
+
+        self.assertEqual(first, second)
+        self.assertEqual(first[0]["Mailing City"], "Clearwater")
+        self.assertEqual(self.cursor.execute.call_count, 1)
+
+    def test_query_criteria_and_limit_are_part_of_the_key(self):
+        self.connector.get_filtered_addresses(CRITERIA)
+        self.connector.get_filtered_addresses(dict(CRITERIA, city="Dunedin"))
+        self.connector.get_filtered_addresses(CRITERIA, limit=10)
+
+        self.assertEqual(self.cursor.execute.call_count, 3)
+
+    def test_callers_get_their_own_dicts(self):
+        self.connector.get_filtered_addresses(CRITERIA)[0]["address1"] = "changed"
+
+        self.assertEqual(self.connector.get_filtered_addresses(CRITERIA)[0]["address1"], "10 Main St")
+
+    def test_invalidate_caches_forces_a_new_query(self):
+        self.connector.get_filtered_addresses(CRITERIA)
+        self.connector.invalidate_caches()
+        self.connector.get_filtered_addresses(CRITERIA)
+
+        self.assertEqual(self.cursor.execute.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
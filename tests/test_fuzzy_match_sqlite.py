@@ -0,0 +1,168 @@
+"""Fuzzy matching against a SQLite-backed golden source (run: python -m unittest discover tests)."""
+import os
+import sqlite3
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import golden_source
+
+
+GOLDEN_ROWS = [
+    ("10 Main St, Clearwater, FL 33755", "Clearwater"),
+    ("10 Main Street Clearwater FL 33755", "Clearwater"),
+    ("10 Mian St Clearwater FL", "Clearwater"),
+    ("12 Main St, Clearwater, FL 33755", "Clearwater"),
+    ("100 Main St, Clearwater, FL 33755", "Clearwater"),
+    ("10 Oak Ave, Dunedin, FL 34698", "Dunedin"),
+]
+
+INTERNAL_ROWS = [
+    ("10 Main St Clearwater FL 33755", "Y"),
+    ("10 Main St Clearwater FL 33755", "N"),
+    ("11 Main St Clearwater FL 33755", "Y"),
+]
+
+
+class FuzzyMatchSqliteTest(unittest.TestCase):
+
+    def setUp(self):
+        handle, self.db_path = tempfile.mkstemp(suffix=".db")
+        os.close(handle)
+        conn = sqlite3.connect(self.db_path)
+        conn.execute('CREATE TABLE golden ("MasterAddress" TEXT, "Mailing City" TEXT)')
+        conn.execute('CREATE TABLE internal ("MasterAddress" TEXT, "Active Customer" TEXT)')
+        conn.executemany('INSERT INTO golden VALUES (?, ?)', GOLDEN_ROWS)
+        conn.executemany('INSERT INTO internal VALUES (?, ?)', INTERNAL_ROWS)
+        conn.commit()
+        conn.close()
+
+        patches = [
+            mock.patch.object(golden_source, "GOLDEN_SOURCE_DB_TYPE", "sqlite"),
+            mock.patch.object(golden_source, "GOLDEN_SOURCE_DATABASE", self.db_path),
+            mock.patch.object(golden_source, "GOLDEN_SOURCE_MATCH_TABLE", "golden"),
+            mock.patch.object(golden_source, "INTERNAL_MATCH_TABLE", "internal"),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+        self.connector = golden_source.GoldenSourceConnector()
+        self.addCleanup(os.remove, self.db_path)
+        self.addCleanup(self.connector.close)
+
+    def _add_golden_row(self, master_address):
+        conn = sqlite3.connect(self.db_path)
+        conn.execute('INSERT INTO golden VALUES (?, ?)', (master_address, "Clearwater"))
+        conn.commit()
+        conn.close()
+
+    def _expire_preloaded_index(self, table_name):
+        loaded_at, index = self.connector._preloaded_tables[table_name]
+        expired_at = loaded_at - golden_source.FUZZY_CORPUS_CACHE_TTL - 1
+        self.connector._preloaded_tables[table_name] = (expired_at, index)
+
+    def test_matches_share_street_number(self):
+        result = self.connector.fuzzy_match_addresses("10 Main St Clearwater FL 33755", threshold=80)
+
+        golden_addresses = sorted(match["MasterAddress"] for match in result["golden_source_matches"])
+        self.assertEqual(golden_addresses, [
+            "10 Main St, Clearwater, FL 33755",
+            "10 Main Street Clearwater FL 33755",
+            "10 Mian St Clearwater FL",
+        ])
+        # Both internal rows with the matching address come back, with their own columns
+        self.assertEqual(sorted(match["Active Customer"] for match in result["internal_matches"]), ["N", "Y"])
+        self.assertEqual(result["total_matches"], 5)
+
+        scores = [match["_similarity_score"] for match in result["golden_source_matches"]]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+        self.assertTrue(all(score >= 80 for score in scores))
+
+    def test_matched_rows_are_fetched_in_batches(self):
+        with mock.patch.object(golden_source, "_ROW_FETCH_BATCH_SIZE", 2):
+            result = self.connector.fuzzy_match_addresses("10 Main St Clearwater FL 33755", threshold=80)
+
+        self.assertEqual(len(result["golden_source_matches"]), 3)
+        self.assertEqual(len(result["internal_matches"]), 2)
+
+    def test_repeat_search_uses_cached_corpus(self):
+        first = self.connector.fuzzy_match_addresses("10 Main St Clearwater FL 33755", threshold=80)
+        second = self.connector.fuzzy_match_addresses("10 Main St Clearwater FL 33755", threshold=80)
+
+        self.assertEqual(
+            [match["MasterAddress"] for match in first["golden_source_matches"]],
+            [match["MasterAddress"] for match in second["golden_source_matches"]],
+        )
+
+    def test_corpus_cache_is_bounded(self):
+        self.assertEqual(self.connector._corpus_cache.maxsize, golden_source.FUZZY_CORPUS_CACHE_SIZE)
+
+        self.connector.fuzzy_match_addresses("10 Main St Clearwater FL 33755", threshold=80)
+
+        self.assertEqual(sorted(self.connector._corpus_cache.keys()), [("golden", "10"), ("internal", "10")])
+
+    def test_preloaded_index(self):
+        self.assertEqual(self.connector.preload_fuzzy_index("golden"), len(GOLDEN_ROWS))
+
+        result = self.connector.fuzzy_match_addresses("10 Main St Clearwater FL 33755", threshold=80)
+
+        self.assertEqual(len(result["golden_source_matches"]), 3)
+
+    def test_expired_preloaded_index_is_reloaded(self):
+        self.connector.preload_fuzzy_index("golden")
+        self._add_golden_row("10 Main St Apt 2 Clearwater FL 33755")
+        self._expire_preloaded_index("golden")
+
+        result = self.connector.fuzzy_match_addresses("10 Main St Clearwater FL 33755", threshold=80)
+
+        self.assertEqual(len(result["golden_source_matches"]), 4)
+
+    def test_invalidated_preloaded_index_is_reloaded(self):
+        self.connector.preload_fuzzy_index("golden")
+        self._add_golden_row("10 Main St Apt 2 Clearwater FL 33755")
+
+        self.connector.invalidate_caches()
+        result = self.connector.fuzzy_match_addresses("10 Main St Clearwater FL 33755", threshold=80)
+
+        # Still answered from a (reloaded) preloaded index rather than the per-request scan
+        self.assertIn("golden", self.connector._preloaded_tables)
+        self.assertNotIn(("golden", "10"), self.connector._corpus_cache)
+        self.assertEqual(len(result["golden_source_matches"]), 4)
+
+    def test_expired_index_is_served_while_another_reload_runs(self):
+        self.connector.preload_fuzzy_index("golden")
+        self._add_golden_row("10 Main St Apt 2 Clearwater FL 33755")
+        self._expire_preloaded_index("golden")
+
+        # Another request holds the table's reload lock: this one keeps using the current index
+        with self.connector._preload_lock("golden"):
+            with mock.patch.object(self.connector, "_load_preloaded_index") as load:
+                result = self.connector.fuzzy_match_addresses("10 Main St Clearwater FL 33755", threshold=80)
+
+        load.assert_not_called()
+        self.assertEqual(len(result["golden_source_matches"]), 3)
+
+    def test_search_error_is_reported(self):
+        error = sqlite3.OperationalError("database is locked")
+        with mock.patch.object(self.connector, "_load_fuzzy_candidates", side_effect=error):
+            result = self.connector.fuzzy_match_addresses("10 Main St Clearwater FL 33755", threshold=80)
+
+        self.assertEqual(result["total_matches"], 0)
+        self.assertEqual(result["search_errors"], {
+            "golden": "database is locked",
+            "internal": "database is locked",
+        })
+
+    def test_no_street_number_match(self):
+        result = self.connector.fuzzy_match_addresses("999 Main St Clearwater FL 33755", threshold=80)
+
+        self.assertEqual(result["total_matches"], 0)
+        self.assertEqual(result["search_errors"], {})
+
+
+if __name__ == "__main__":
+    unittest.main()
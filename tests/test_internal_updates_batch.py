@@ -0,0 +1,79 @@
+"""Batched writes to internal_updates (run: python -m unittest discover tests)."""
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import golden_source
+
+
+RECORDS = [
+    {"MasterAddress": "10 Main St Clearwater FL", "Mailing City": "Clearwater"},
+    {"MasterAddress": "12 Main St Clearwater FL", "Mailing City": "Clearwater"},
+]
+
+
+class PushToInternalUpdatesBatchTest(unittest.TestCase):
+
+    def setUp(self):
+        patches = [
+            mock.patch.object(golden_source, "GOLDEN_SOURCE_DB_TYPE", "sqlite"),
+            mock.patch.object(golden_source, "GOLDEN_SOURCE_DATABASE", ":memory:"),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+        self.connector = golden_source.GoldenSourceConnector()
+        self.addCleanup(self.connector.close)
+        conn = self.connector.connection
+        conn.execute("ATTACH DATABASE ':memory:' AS team_cool_and_gang")
+        conn.execute(
+            'CREATE TABLE team_cool_and_gang.internal_updates ('
+            '"MasterAddress" TEXT, "Mailing City" TEXT, "Agent Action" TEXT, "tpi" REAL, "datetime" TEXT)'
+        )
+
+    def _row_count(self):
+        return self.connector.connection.execute(
+            'SELECT COUNT(*) FROM team_cool_and_gang.internal_updates'
+        ).fetchone()[0]
+
+    def test_inserts_every_record(self):
+        result = self.connector.push_to_internal_updates_batch(RECORDS)
+
+        self.assertEqual(result["status"], "success")
+        self.assertEqual(self._row_count(), 2)
+
+    def test_failed_group_rolls_back_the_whole_batch(self):
+        # The second column group names a column internal_updates doesn't have
+        records = RECORDS + [{"MasterAddress": "14 Main St Clearwater FL", "No Such Column": "x"}]
+
+        result = self.connector.push_to_internal_updates_batch(records)
+
+        self.assertEqual(result["status"], "error")
+        self.assertEqual(self._row_count(), 0)
+
+    def test_postgresql_batch_runs_outside_autocommit(self):
+        conn = mock.MagicMock(autocommit=True)
+        autocommit_during_insert = []
+
+        def fail_insert(cursor, query, rows, page_size):
+            autocommit_during_insert.append(conn.autocommit)
+            raise RuntimeError("insert failed")
+
+        self.connector.db_type = "postgresql"
+        with mock.patch.object(self.connector, "_connection", conn), \
+                mock.patch("psycopg2.extras.execute_batch", side_effect=fail_insert):
+            result = self.connector.push_to_internal_updates_batch(RECORDS)
+
+        self.assertEqual(result["status"], "error")
+        self.assertEqual(autocommit_during_insert, [False])
+        conn.rollback.assert_called_once()
+        conn.commit.assert_not_called()
+        self.assertTrue(conn.autocommit)
+
+
+if __name__ == "__main__":
+    unittest.main()
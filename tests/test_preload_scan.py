@@ -0,0 +1,54 @@
+"""Preloaded-index scans on PostgreSQL, with and without a psycopg2 wait callback (run: python -m unittest discover tests)."""
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import golden_source
+
+
+ADDRESSES = ["10 Main St Clearwater FL", "12 Main St Clearwater FL"]
+
+
+class PreloadScanTest(unittest.TestCase):
+
+    def setUp(self):
+        patches = [
+            mock.patch.object(golden_source, "GOLDEN_SOURCE_DB_TYPE", "sqlite"),
+            mock.patch.object(golden_source, "GOLDEN_SOURCE_DATABASE", ":memory:"),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+        self.connector = golden_source.GoldenSourceConnector()
+        self.addCleanup(self.connector.close)
+        # Stand in a PostgreSQL connection: the named scan cursor returns one batch, COPY writes CSV
+        self.connector.db_type = "postgresql"
+        self.connector._connection = mock.MagicMock()
+        self.cursor = self.connector._connection.cursor.return_value
+        self.cursor.fetchmany.side_effect = [[(address,) for address in ADDRESSES], []]
+        self.cursor.copy_expert.side_effect = lambda query, buffer: buffer.write("\n".join(ADDRESSES) + "\n")
+
+    def test_copy_without_wait_callback(self):
+        with mock.patch("psycopg2.extensions.get_wait_callback", return_value=None):
+            addresses = list(self.connector._scan_master_addresses('"golden"'))
+
+        self.assertEqual(addresses, ADDRESSES)
+        self.cursor.copy_expert.assert_called_once()
+
+    def test_batched_scan_with_wait_callback(self):
+        # psycogreen's callback makes copy_expert raise ProgrammingError, so COPY mustn't be used
+        self.cursor.copy_expert.side_effect = AssertionError("copy_expert used with a wait callback")
+        with mock.patch("psycopg2.extensions.get_wait_callback", return_value=lambda conn: None):
+            addresses = list(self.connector._scan_master_addresses('"golden"'))
+
+        self.assertEqual(addresses, ADDRESSES)
+        self.connector._connection.cursor.assert_called_once_with(name="fuzzy_scan", withhold=True)
+        self.cursor.copy_expert.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
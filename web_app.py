@@ -1,41 +1,215 @@
 """Flask web application for OneTrueAddress agent."""
 from flask import Flask, render_template, request, jsonify
-from address_agent import AddressAgent
-from api_routes import api
-import traceback
+from flask.json.provider import DefaultJSONProvider
+from api_routes import api, get_agent, close_agent
+from cachetools import TTLCache
+from config import LOG_LEVEL, MATCH_CACHE_TTL, MAX_REQUEST_BYTES, TIME_SAVED_CACHE_TTL
+from werkzeug.exceptions import HTTPException
+import logging
+import orjson
+import threading
 import atexit
 
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson (C serializer, writes bytes directly).
+    
+    Types orjson doesn't handle natively (Decimal, datetime, ...) go through Flask's default
+    hook, so responses look the same as with the standard provider. numpy values (similarity
+    scores) and non-string dict keys are serialized directly.
+    """
+    
+    def _options(self, indent: bool = False) -> int:
+        option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return option
+    
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=self.default, option=self._options(bool(kwargs.get('indent')))).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        body = orjson.dumps(obj, default=self.default, option=self._options(indent) | orjson.OPT_APPEND_NEWLINE)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+
+# Send app log records (web_app, golden_source, ...) to stderr at LOG_LEVEL; gunicorn only configures its own loggers
+logging.basicConfig(level=LOG_LEVEL, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+_log = logging.getLogger(__name__)
+
 app = Flask(__name__)
+# Reject oversized bodies (413) before they're read into memory
+app.config['MAX_CONTENT_LENGTH'] = MAX_REQUEST_BYTES
+app.json = OrjsonProvider(app)
+# Compact, unsorted JSON in every mode (no debug pretty-printing, keys in insertion order)
+app.json.compact = True
+app.json.sort_keys = False
 
 # Register API blueprint
 app.register_blueprint(api)
 
-# Global agent instance (initialized on first use)
-agent = None
-
-def get_agent():
-    """Get or create the address agent instance."""
-    global agent
-    if agent is None:
-        agent = AddressAgent()
-    return agent
+# The agent instance is shared with the API blueprint (see api_routes.get_agent);
+# gunicorn workers create it at startup, otherwise it's created on first use
 
 def cleanup_agent():
     """Clean up the agent on application shutdown."""
-    global agent
-    if agent is not None:
-        try:
-            agent.close()
-        except:
-            pass
+    try:
+        close_agent()
+    except:
+        pass
 
 # Register cleanup function
 atexit.register(cleanup_agent)
 
+# Recent /match results keyed by (whitespace-normalized address, threshold), so a re-submitted
+# address skips the fuzzy search and Claude review. Each entry records the connector's write
+# generation, so any write through the shared agent (web UI or /api/v1) invalidates it
+_match_cache = TTLCache(maxsize=4096, ttl=MATCH_CACHE_TTL)
+_match_cache_lock = threading.Lock()
+
+def _cached_match(input_address, threshold):
+    """
+    Match an address, reusing a recent result for the same address and threshold.
+    
+    Degraded results (a table search or the Claude review failed) are returned but not cached,
+    so a brief outage doesn't keep serving fallback answers. Results cached before the last
+    write to the database are ignored. The cached result is shared between requests, so
+    callers must not modify it.
+    
+    Args:
+        input_address: Address to match (whitespace already collapsed)
+        threshold: Optional similarity threshold from the request (a float, or None)
+        
+    Returns:
+        The agent's match result
+    """
+    agent = get_agent()
+    cache_key = (input_address, threshold)
+    with _match_cache_lock:
+        cached = _match_cache.get(cache_key)
+    if cached is not None and cached[0] == agent.golden_source.write_generation:
+        return cached[1]
+    
+    # Read the generation before matching, so a write that lands mid-search invalidates this result
+    write_generation = agent.golden_source.write_generation
+    result = agent.match_address(input_address, threshold=threshold)
+    if not result.get('degraded'):
+        with _match_cache_lock:
+            _match_cache[cache_key] = (write_generation, result)
+    return result
+
+def _get_json_body():
+    """
+    Parse the request body as a JSON object with orjson.
+    
+    The raw body is read once (not cached on the request) and decoded directly.
+    
+    Returns:
+        The parsed dict, or None if the body is not a valid JSON object
+    """
+    try:
+        data = orjson.loads(request.get_data(cache=False))
+    except orjson.JSONDecodeError:
+        return None
+    return data if isinstance(data, dict) else None
+
+def _invalid_json_response():
+    """Response for a request body that isn't a JSON object."""
+    return jsonify({
+        'success': False,
+        'error': 'Request body must be a JSON object.'
+    }), 400
+
+def _format_fuzzy(result, response_data):
+    """Add the fields of a fuzzy match result (with or without AI review) to the /match response."""
+    match_found = result.get('match_found', False)
+    response_data.update({
+        'match_found': match_found,
+        'confidence': result.get('confidence', 0),
+        'similarity_score': result.get('similarity_score', 0),
+        'reasoning': result.get('reasoning', 'N/A'),
+        'business_rule_exception': result.get('business_rule_exception', False)
+    })
+    
+    # Include Claude review if available
+    if 'claude_review' in result:
+        response_data['claude_review'] = result['claude_review']
+    
+    if match_found:
+        best_match = result.get('best_match') or {}
+        
+        # Include separate match lists for Golden Source and Internal
+        golden_source_matches = result.get('golden_source_matches') or []
+        internal_matches = result.get('internal_matches') or []
+        
+        response_data.update({
+            'matched_address': best_match,
+            'source_table': best_match.get('_source_table', 'Unknown'),
+            'source_type': best_match.get('_source_type', 'unknown'),
+            'golden_source_matches': golden_source_matches[:10],  # Limit to top 10
+            'internal_matches': internal_matches[:10],  # Limit to top 10
+            'total_golden_source': len(golden_source_matches),
+            'total_internal': len(internal_matches),
+            'has_golden_source': result.get('has_golden_source', False),
+            'has_internal': result.get('has_internal', False)
+        })
+
+def _format_legacy(result, response_data):
+    """Add the fields of a legacy Claude response (for backward compatibility) to the /match response."""
+    claude_response = result.get('claude_response', {})
+    if not isinstance(claude_response, dict):
+        response_data['match_found'] = False
+        response_data['raw_response'] = result.get('raw_response', 'No response')
+        return
+    
+    match_found = claude_response.get('match_found', False)
+    response_data.update({
+        'match_found': match_found,
+        'confidence': claude_response.get('confidence', 'N/A'),
+        'reasoning': claude_response.get('reasoning', 'N/A'),
+        'business_rule_exception': claude_response.get('business_rule_exception', False)
+    })
+    
+    if match_found:
+        response_data.update({
+            'matched_address': claude_response.get('matched_address', {}),
+            # Include internal matches if available
+            'internal_matches': result.get('internal_matches', []),
+            # Include exact match info
+            'exact_match_info': result.get('exact_match_info', {"is_exact_match": False}),
+            # Include no internal match flag
+            'no_internal_match': result.get('no_internal_match', False)
+        })
+
+# /match response formatter for each search method; anything else is a legacy Claude response
+_RESPONSE_FORMATTERS = {
+    'fuzzy_match': _format_fuzzy,
+    'fuzzy_match_with_ai': _format_fuzzy
+}
+
+# Rendered index page (it takes no per-request context, so it's rendered once per process)
+_index_html = None
+
 @app.route('/')
 def index():
     """Render the main page."""
-    response = app.make_response(render_template('index.html'))
+    global _index_html
+    if app.debug:
+        # Re-render every time so template edits show up while developing
+        html = render_template('index.html')
+    else:
+        if _index_html is None:
+            # Rendered on first request rather than at import: url_for needs a request context
+            _index_html = render_template('index.html').encode('utf-8')
+        html = _index_html
+    response = app.response_class(html, mimetype='text/html')
     response.headers['Cache-Control'] = 'no-store, no-cache, must-revalidate, max-age=0'
     response.headers['Pragma'] = 'no-cache'
     response.headers['Expires'] = '0'
@@ -44,256 +218,200 @@ def index():
 @app.route('/match', methods=['POST'])
 def match_address():
     """Handle address matching request."""
-    try:
-        data = request.get_json()
-        input_address = data.get('address', '').strip()
-        threshold = data.get('threshold', None)  # Get threshold from request
-        
-        if not input_address:
+    data = _get_json_body()
+    if data is None:
+        return _invalid_json_response()
+    input_address = ' '.join(data.get('address', '').split())
+    threshold = data.get('threshold', None)  # Get threshold from request
+    
+    if not input_address:
+        return jsonify({
+            'success': False,
+            'error': 'Please enter an address to match.'
+        }), 400
+    
+    if threshold is not None:
+        try:
+            threshold = float(threshold)
+        except (TypeError, ValueError):
             return jsonify({
                 'success': False,
-                'error': 'Please enter an address to match.'
+                'error': 'Threshold must be a number.'
             }), 400
-        
-        # Get agent and match address with optional threshold
-        agent = get_agent()
-        result = agent.match_address(input_address, threshold=threshold)
-        
-        # Format the response for the UI (handles both fuzzy match and old format)
-        response_data = {
-            'success': True,
-            'input_address': result.get('input_address', input_address),
-            'candidates_searched': result.get('candidates_searched', 0),
-            'confidence_threshold': result.get('confidence_threshold', 90.0),
-            'search_method': result.get('search_method', 'unknown')
-        }
-        
-        # Handle fuzzy match response format (with or without AI review)
-        if result.get('search_method') in ['fuzzy_match', 'fuzzy_match_with_ai']:
-            response_data['match_found'] = result.get('match_found', False)
-            response_data['confidence'] = result.get('confidence', 0)
-            response_data['similarity_score'] = result.get('similarity_score', 0)
-            response_data['reasoning'] = result.get('reasoning', 'N/A')
-            response_data['business_rule_exception'] = result.get('business_rule_exception', False)
-            
-            # Include Claude review if available
-            if 'claude_review' in result:
-                response_data['claude_review'] = result['claude_review']
-            
-            if response_data['match_found']:
-                best_match = result.get('best_match', {})
-                response_data['matched_address'] = best_match
-                response_data['source_table'] = best_match.get('_source_table', 'Unknown')
-                response_data['source_type'] = best_match.get('_source_type', 'unknown')
-                
-                # Include separate match lists for Golden Source and Internal
-                golden_source_matches = result.get('golden_source_matches', [])
-                internal_matches = result.get('internal_matches', [])
-                
-                response_data['golden_source_matches'] = golden_source_matches[:10]  # Limit to top 10
-                response_data['internal_matches'] = internal_matches[:10]  # Limit to top 10
-                response_data['total_golden_source'] = len(golden_source_matches)
-                response_data['total_internal'] = len(internal_matches)
-                response_data['has_golden_source'] = result.get('has_golden_source', False)
-                response_data['has_internal'] = result.get('has_internal', False)
-        else:
-            # Handle legacy Claude response format (for backward compatibility)
-            claude_response = result.get('claude_response', {})
-            if isinstance(claude_response, dict):
-                response_data['match_found'] = claude_response.get('match_found', False)
-                response_data['confidence'] = claude_response.get('confidence', 'N/A')
-                response_data['reasoning'] = claude_response.get('reasoning', 'N/A')
-                response_data['business_rule_exception'] = claude_response.get('business_rule_exception', False)
-                
-                if response_data['match_found']:
-                    matched_address = claude_response.get('matched_address', {})
-                    response_data['matched_address'] = matched_address
-                    
-                    # Include internal matches if available
-                    internal_matches = result.get('internal_matches', [])
-                    response_data['internal_matches'] = internal_matches
-                    
-                    # Include exact match info
-                    exact_match_info = result.get('exact_match_info', {"is_exact_match": False})
-                    response_data['exact_match_info'] = exact_match_info
-                    
-                    # Include no internal match flag
-                    no_internal_match = result.get('no_internal_match', False)
-                    response_data['no_internal_match'] = no_internal_match
-            else:
-                response_data['match_found'] = False
-                response_data['raw_response'] = result.get('raw_response', 'No response')
-        
-        return jsonify(response_data)
-        
-    except Exception as e:
-        error_msg = str(e)
-        traceback.print_exc()
-        return jsonify({
-            'success': False,
-            'error': error_msg
-        }), 500
+    
+    # Match address with optional threshold (repeat lookups are served from the cache)
+    result = _cached_match(input_address, threshold)
+    
+    # Format the response for the UI (handles both fuzzy match and old format)
+    response_data = {
+        'success': True,
+        'input_address': result.get('input_address', input_address),
+        'candidates_searched': result.get('candidates_searched', 0),
+        'confidence_threshold': result.get('confidence_threshold', 90.0),
+        'search_method': result.get('search_method', 'unknown')
+    }
+    
+    # Fill in the fields for the result's format (fuzzy match, or legacy Claude response)
+    _RESPONSE_FORMATTERS.get(result.get('search_method'), _format_legacy)(result, response_data)
+    
+    return jsonify(response_data)
 
 @app.route('/push_updates', methods=['POST'])
 def push_updates():
     """Handle push updates request to consolidate and write to internalupdates table."""
-    try:
-        data = request.get_json()
-        internal_matches = data.get('internal_matches', [])
-        golden_source_address = data.get('golden_source_address', {})
-        scenario = data.get('scenario', 1)  # Default to scenario 1 (multiple matches)
-        
-        # Debug logging
-        print(f"\n[Push Updates Request Debug]")
-        print(f"  Request data keys: {list(data.keys())}")
-        print(f"  Internal matches count: {len(internal_matches)}")
-        print(f"  Golden source address keys: {list(golden_source_address.keys()) if golden_source_address else 'None'}")
-        print(f"  Golden source address: {golden_source_address}")
-        print(f"  Scenario: {scenario}")
-        
-        if not internal_matches:
+    data = _get_json_body()
+    if data is None:
+        return _invalid_json_response()
+    internal_matches = data.get('internal_matches', [])
+    golden_source_address = data.get('golden_source_address', {})
+    scenario = data.get('scenario', 1)  # Default to scenario 1 (multiple matches)
+    
+    # Debug logging (arguments are only formatted when debug logging is enabled)
+    _log.debug(
+        "Push updates request: data keys=%s, internal matches=%d, golden source address keys=%s, "
+        "golden source address=%s, scenario=%s",
+        data.keys(), len(internal_matches),
+        golden_source_address.keys() if golden_source_address else None,
+        golden_source_address, scenario
+    )
+    
+    if not internal_matches:
+        return jsonify({
+            'success': False,
+            'error': 'No Internal matches provided.'
+        }), 400
+    
+    if not golden_source_address or len(golden_source_address) == 0:
+        error_msg = f'No Golden Source address provided. Received: {golden_source_address}'
+        _log.warning("Push to internal updates failed: %s", error_msg)
+        return jsonify({
+            'success': False,
+            'error': error_msg
+        }), 400
+    
+    # Get agent and consolidate records
+    agent = get_agent()
+    
+    # Step 1: Consolidate the records using Golden Source address
+    consolidation_result = agent.golden_source.consolidate_internal_records(internal_matches, golden_source_address, scenario)
+    
+    if consolidation_result['status'] == 'error':
+        if consolidation_result.get('requires_manual_review'):
             return jsonify({
                 'success': False,
-                'error': 'No Internal matches provided.'
+                'error': consolidation_result['error'],
+                'requires_manual_review': True
             }), 400
-        
-        if not golden_source_address or len(golden_source_address) == 0:
-            error_msg = f'No Golden Source address provided. Received: {golden_source_address}'
-            print(f"  ERROR: {error_msg}")
+        else:
             return jsonify({
                 'success': False,
-                'error': error_msg
+                'error': consolidation_result['error']
             }), 400
-        
-        # Get agent and consolidate records
-        agent = get_agent()
-        
-        # Step 1: Consolidate the records using Golden Source address
-        consolidation_result = agent.golden_source.consolidate_internal_records(internal_matches, golden_source_address, scenario)
-        
-        if consolidation_result['status'] == 'error':
-            if consolidation_result.get('requires_manual_review'):
-                return jsonify({
-                    'success': False,
-                    'error': consolidation_result['error'],
-                    'requires_manual_review': True
-                }), 400
-            else:
-                return jsonify({
-                    'success': False,
-                    'error': consolidation_result['error']
-                }), 400
-        
-        # Step 2: Push the consolidated record to internalupdates table
-        consolidated_record = consolidation_result['consolidated_record']
-        push_result = agent.golden_source.push_to_internal_updates(consolidated_record, scenario)
-        
-        if push_result['status'] == 'error':
-            return jsonify({
-                'success': False,
-                'error': push_result['error']
-            }), 500
-        
-        return jsonify({
-            'success': True,
-            'message': push_result['message'],
-            'consolidated_record': consolidated_record
-        })
-        
-    except Exception as e:
-        error_msg = str(e)
-        traceback.print_exc()
+    
+    # Step 2: Push the consolidated record to internalupdates table
+    consolidated_record = consolidation_result['consolidated_record']
+    push_result = agent.golden_source.push_to_internal_updates(consolidated_record, scenario)
+    
+    if push_result['status'] == 'error':
         return jsonify({
             'success': False,
-            'error': error_msg
+            'error': push_result['error']
         }), 500
+    
+    return jsonify({
+        'success': True,
+        'message': push_result['message'],
+        'consolidated_record': consolidated_record
+    })
 
 @app.route('/write_to_internal', methods=['POST'])
 def write_to_internal():
     """Handle writing Golden Source record to internal_updates when no internal match found."""
-    try:
-        data = request.get_json()
-        golden_source_record = data.get('golden_source_record', {})
-        
-        if not golden_source_record:
-            return jsonify({
-                'success': False,
-                'error': 'No Golden Source record provided.'
-            }), 400
-        
-        # Get agent and write the record
-        agent = get_agent()
-        
-        # Transform Golden Source column names to Internal table column names
-        print(f"\n[Write to Internal - Transform Golden Source Record]")
-        print(f"  Original Golden Source record: {golden_source_record}")
-        
-        internal_record = agent.golden_source._map_golden_source_to_internal(golden_source_record)
-        
-        print(f"  Transformed Internal record: {internal_record}")
-        
-        if not internal_record or len(internal_record) == 0:
-            return jsonify({
-                'success': False,
-                'error': 'Failed to transform Golden Source record to Internal format. No valid fields found.'
-            }), 400
-        
-        # Push the transformed record to internal_updates table
-        # Scenario 3: No Internal Match (Golden Source Only)
-        push_result = agent.golden_source.push_to_internal_updates(internal_record, scenario=3)
-        
-        if push_result['status'] == 'error':
-            return jsonify({
-                'success': False,
-                'error': push_result['error']
-            }), 500
-        
+    data = _get_json_body()
+    if data is None:
+        return _invalid_json_response()
+    golden_source_record = data.get('golden_source_record', {})
+    
+    if not golden_source_record:
         return jsonify({
-            'success': True,
-            'message': push_result['message'],
-            'written_record': internal_record
-        })
-        
-    except Exception as e:
-        error_msg = str(e)
-        traceback.print_exc()
+            'success': False,
+            'error': 'No Golden Source record provided.'
+        }), 400
+    
+    # Get agent and write the record
+    agent = get_agent()
+    
+    # Transform Golden Source column names to Internal table column names
+    internal_record = agent.golden_source._map_golden_source_to_internal(golden_source_record)
+    
+    _log.debug("Write to internal: Golden Source record %s transformed to Internal record %s",
+               golden_source_record, internal_record)
+    
+    if not internal_record or len(internal_record) == 0:
         return jsonify({
             'success': False,
-            'error': error_msg
+            'error': 'Failed to transform Golden Source record to Internal format. No valid fields found.'
+        }), 400
+    
+    # Push the transformed record to internal_updates table
+    # Scenario 3: No Internal Match (Golden Source Only)
+    push_result = agent.golden_source.push_to_internal_updates(internal_record, scenario=3)
+    
+    if push_result['status'] == 'error':
+        return jsonify({
+            'success': False,
+            'error': push_result['error']
         }), 500
+    
+    return jsonify({
+        'success': True,
+        'message': push_result['message'],
+        'written_record': internal_record
+    })
+
+# Health check body, encoded once (load balancers poll this constantly)
+_HEALTH_BYTES = orjson.dumps({'status': 'ok'}, option=orjson.OPT_APPEND_NEWLINE)
 
 @app.route('/health', methods=['GET'])
 def health():
     """Health check endpoint."""
-    return jsonify({'status': 'ok'})
+    return app.response_class(_HEALTH_BYTES, mimetype='application/json')
 
 @app.route('/time_saved', methods=['GET'])
 def time_saved():
     """Get the total time saved by the system."""
-    try:
-        agent = get_agent()
-        result = agent.golden_source.get_time_saved()
-        
-        if result['status'] == 'success':
-            return jsonify({
-                'success': True,
-                'hours_saved': result['hours_saved']
-            })
-        else:
-            return jsonify({
-                'success': False,
-                'hours_saved': 0.0,
-                'error': result.get('error', 'Unknown error')
-            })
-            
-    except Exception as e:
-        error_msg = str(e)
-        traceback.print_exc()
+    agent = get_agent()
+    result = agent.golden_source.get_time_saved()
+    
+    if result['status'] == 'success':
+        response = jsonify({
+            'success': True,
+            'hours_saved': result['hours_saved']
+        })
+        # The total changes slowly and the UI polls it: tag it so unchanged polls get a bodiless 304
+        response.add_etag()
+        response.cache_control.private = True
+        response.cache_control.max_age = int(TIME_SAVED_CACHE_TTL)
+        return response.make_conditional(request)
+    else:
         return jsonify({
             'success': False,
             'hours_saved': 0.0,
-            'error': error_msg
-        }), 500
+            'error': result.get('error', 'Unknown error')
+        })
+
+@app.errorhandler(Exception)
+def handle_exception(e):
+    """Return unhandled errors from the web UI and /api/v1 routes as JSON; HTTP errors (400, 404, 413, ...) pass through."""
+    if isinstance(e, HTTPException):
+        return e
+    _log.exception("Request to %s failed", request.path)
+    response_data = {'success': False}
+    if request.endpoint in ('time_saved', 'api.time_saved'):
+        # The time saved display reads this field even when the lookup fails
+        response_data['hours_saved'] = 0.0
+    response_data['error'] = str(e)
+    return jsonify(response_data), 500
 
 @app.after_request
 def add_header(response):
@@ -306,6 +424,16 @@ def add_header(response):
 
 if __name__ == '__main__':
     import os
+    import signal
+    import sys
+    
+    # Clean up on SIGTERM too (e.g. container stop). Only for the development server:
+    # under gunicorn the worker owns SIGTERM and the worker_exit hook does the cleanup
+    def _handle_sigterm(signum, frame):
+        cleanup_agent()
+        sys.exit(0)
+    signal.signal(signal.SIGTERM, _handle_sigterm)
+    
     port = int(os.getenv('PORT', 5000))
     debug = os.getenv('FLASK_ENV', 'production') == 'development'
     app.run(debug=debug, host='0.0.0.0', port=port)